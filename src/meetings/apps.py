@@ -5,3 +5,9 @@ class MeetingsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'meetings'
     verbose_name = 'Meeting Scheduler'
+
+    def ready(self):
+        # Pre-compile the email templates so the first outbound email of
+        # each process does not pay the template-parse cost.
+        from .email_utils import prime_template_cache
+        prime_template_cache()
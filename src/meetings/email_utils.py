@@ -3,12 +3,58 @@ Email Utility Functions using Resend API
 Handles sending emails for verification, invitations, and notifications
 """
 import logging
+from functools import lru_cache
 from django.conf import settings
-from django.template.loader import render_to_string
+from django.template import loader
 from django.utils.html import strip_tags
 
 logger = logging.getLogger(__name__)
 
+# Resend's batch endpoint rejects calls with more than 100 messages,
+# so larger invitations are sent in chunks of this size.
+RESEND_BATCH_LIMIT = 100
+
+# The full set of templates the send_*_email helpers render. Known up
+# front so the compiled-template cache can be primed at app startup.
+EMAIL_TEMPLATE_NAMES = (
+    'meetings/emails/verify_email.html',
+    'meetings/emails/meeting_invitation.html',
+    'meetings/emails/meeting_locked.html',
+    'meetings/emails/password_reset.html',
+)
+
+
+@lru_cache(maxsize=128)
+def _get_email_template(template_name):
+    """
+    Memoize compiled email templates by name.
+    Template parsing/compilation is the expensive part of rendering;
+    the context bindings stay dynamic so per-user content is never cached.
+    """
+    return loader.get_template(template_name)
+
+
+def render_to_string(template_name, context=None):
+    """
+    Drop-in replacement for django.template.loader.render_to_string
+    that renders through the compiled-template cache above.
+    """
+    return _get_email_template(template_name).render(context)
+
+
+def prime_template_cache():
+    """
+    Compile every known email template into the cache ahead of time.
+    Called from MeetingsConfig.ready() so the first email sent by a
+    process pays no template-parse cost. Failures are logged, not raised:
+    a missing template should surface when (and if) it is actually used.
+    """
+    for name in EMAIL_TEMPLATE_NAMES:
+        try:
+            _get_email_template(name)
+        except Exception as e:
+            logger.warning(f"Could not pre-compile email template {name}: {e}")
+
 
 def send_email_via_resend(to_email, subject, html_content, from_email=None):
     """
@@ -59,6 +105,91 @@ def send_email_via_resend(to_email, subject, html_content, from_email=None):
         return False
 
 
+def send_emails_batch_via_resend(messages, from_email=None):
+    """
+    Send multiple emails in a single Resend batch API call
+
+    Amortizes the HTTP handshake across all messages instead of one
+    round-trip per recipient.
+
+    Args:
+        messages: List of dicts with 'to', 'subject' and 'html' keys
+        from_email: Sender email (optional, uses DEFAULT_FROM_EMAIL if not provided)
+
+    Returns:
+        int: Number of emails handed to the API (0 on failure)
+    """
+    if not messages:
+        return 0
+
+    try:
+        import resend
+
+        api_key = settings.RESEND_API_KEY
+        if not api_key:
+            logger.warning("RESEND_API_KEY not configured. Batch email not sent.")
+            logger.info(f"Batch of {len(messages)} emails would be sent")
+            return 0
+
+        resend.api_key = api_key
+
+        if not from_email:
+            from_email = settings.DEFAULT_FROM_EMAIL
+
+        params = [
+            {
+                "from": from_email,
+                "to": [m["to"]] if isinstance(m["to"], str) else m["to"],
+                "subject": m["subject"],
+                "html": m["html"],
+            }
+            for m in messages
+        ]
+
+    except Exception as e:
+        logger.error(f"Failed to prepare batch email: {str(e)}")
+        return 0
+
+    # Send in chunks of RESEND_BATCH_LIMIT: the API caps one call at 100
+    # messages, and counting per chunk means one failed call only loses
+    # that chunk rather than zeroing the whole batch.
+    sent_count = 0
+    for start in range(0, len(params), RESEND_BATCH_LIMIT):
+        chunk = params[start:start + RESEND_BATCH_LIMIT]
+        try:
+            response = resend.Batch.send(chunk)
+            logger.info(f"Batch email sent ({len(chunk)} messages): {response}")
+            sent_count += len(chunk)
+        except Exception as e:
+            logger.error(f"Failed to send batch email: {str(e)}")
+
+    return sent_count
+
+
+def build_meeting_invitation_message(participant, meeting_request, respond_url):
+    """
+    Build the message dict for one participant's invitation email
+
+    Used with send_emails_batch_via_resend to invite many participants
+    in a single API call. Returns None if the participant has no email.
+    """
+    if not participant.email:
+        return None
+
+    context = {
+        'participant': participant,
+        'meeting_request': meeting_request,
+        'respond_url': respond_url,
+        'site_name': 'TimeWeave',
+    }
+
+    return {
+        'to': participant.email,
+        'subject': f'Mời tham gia cuộc họp: {meeting_request.title}',
+        'html': render_to_string('meetings/emails/meeting_invitation.html', context),
+    }
+
+
 def send_verification_email(user, verification_url):
     """
     Send email verification link to new user
@@ -8,7 +8,6 @@ from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
 from .models import MeetingRequest, Participant, BusySlot
 from datetime import datetime, timedelta, date
-import pytz
 
 
 class UserRegistrationForm(UserCreationForm):
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 00:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0005_userprofile_password_reset_token_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='suggestedslot',
+            index=models.Index(fields=['meeting_request', 'start_time', 'end_time'], name='suggested_s_meeting_ce1b31_idx'),
+        ),
+    ]
@@ -8,7 +8,6 @@ from datetime import datetime, timedelta
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
-import pytz
 
 # Import UserProfile to ensure it's loaded
 from .user_profile import UserProfile
@@ -254,6 +253,7 @@ class SuggestedSlot(models.Model):
         indexes = [
             models.Index(fields=['meeting_request', '-available_count']),
             models.Index(fields=['meeting_request', 'is_locked']),
+            models.Index(fields=['meeting_request', 'start_time', 'end_time']),
         ]
     
     @property
@@ -2,32 +2,34 @@
 Custom template filters for time-manager
 """
 from django import template
-from datetime import datetime
+from datetime import date
 
 register = template.Library()
 
+# Vietnamese day names, indexed by date.weekday()
+DAY_NAMES = ('T2', 'T3', 'T4', 'T5', 'T6', 'T7', 'CN')
+
 @register.filter
 def get_item(dictionary, key):
     """
     Template filter to get an item from a dictionary
     Usage: {{ mydict|get_item:key }}
     """
-    if dictionary is None:
-        return None
-    return dictionary.get(key)
+    return (dictionary or {}).get(key)
 
 @register.filter
 def format_date_header(date_str):
     """
     Format date string for heatmap header
     Usage: {{ date_str|format_date_header }}
-    Converts '2024-01-15' to 'Mon 15/1'
+    Converts '2024-01-15' to 'T2 15/1'
+
+    Runs once per heatmap column per render, so it uses
+    date.fromisoformat (much cheaper than strptime, which re-parses its
+    format string on every call) and a module-level day-name tuple.
     """
     try:
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        # Vietnamese day names
-        day_names = ['T2', 'T3', 'T4', 'T5', 'T6', 'T7', 'CN']
-        day_name = day_names[date_obj.weekday()]
-        return f"{day_name} {date_obj.day}/{date_obj.month}"
-    except:
+        date_obj = date.fromisoformat(date_str)
+    except (TypeError, ValueError):
         return date_str
+    return f"{DAY_NAMES[date_obj.weekday()]} {date_obj.day}/{date_obj.month}"
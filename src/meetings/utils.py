@@ -3,12 +3,25 @@ Utility functions for calculating available time slots
 Heatmap generation and slot suggestions
 """
 from datetime import datetime, timedelta, time
+from functools import lru_cache
 from typing import List, Dict, Tuple
 from django.utils import timezone
 from django.db.models import Q
 import pytz
 
 
+@lru_cache(maxsize=128)
+def _get_timezone(name):
+    """
+    Memoized pytz.timezone lookup.
+
+    Participants cluster around a handful of timezones, so repeat lookups
+    (one per request in the slot/heatmap/parse paths) become a dict hit
+    instead of a pytz database walk.
+    """
+    return pytz.timezone(name)
+
+
 def generate_time_slots(meeting_request):
     """
     Generate all possible time slots based on meeting request configuration
@@ -17,7 +30,7 @@ def generate_time_slots(meeting_request):
     slots = []
     
     # Get timezone
-    tz = pytz.timezone(meeting_request.timezone)
+    tz = _get_timezone(meeting_request.timezone)
     
     # Iterate through date range
     current_date = meeting_request.date_range_start
@@ -164,6 +177,32 @@ def get_top_suggestions(meeting_request, limit=10, min_availability_pct=50):
     return filtered_suggestions[:limit]
 
 
+def _availability_stats(available, total):
+    """
+    Compute (level, percentage) for a heatmap cell from raw counts.
+
+    Mirrors SuggestedSlot.availability_percentage / heatmap_level but works
+    on plain integers, so heatmap generation can run on values_list() rows
+    without instantiating a model per cell.
+    """
+    if total == 0:
+        return 0, 0
+    percentage = round((available / total) * 100, 1)
+    if percentage >= 80:
+        level = 5
+    elif percentage >= 60:
+        level = 4
+    elif percentage >= 40:
+        level = 3
+    elif percentage >= 20:
+        level = 2
+    elif percentage > 0:
+        level = 1
+    else:
+        level = 0
+    return level, percentage
+
+
 def get_heatmap_data(meeting_request, participant_timezone='Asia/Ho_Chi_Minh'):
     """
     Generate heatmap data for visualization
@@ -186,7 +225,7 @@ def get_heatmap_data(meeting_request, participant_timezone='Asia/Ho_Chi_Minh'):
     """
     from .models import SuggestedSlot
     
-    tz = pytz.timezone(participant_timezone)
+    tz = _get_timezone(participant_timezone)
     
     # Get all suggested slots
     slots = SuggestedSlot.objects.filter(meeting_request=meeting_request)
@@ -198,23 +237,17 @@ def get_heatmap_data(meeting_request, participant_timezone='Asia/Ho_Chi_Minh'):
         
         # Organize data by date and time
         heatmap = {}
-        dates_set = set()
         times_set = set()
-        
+
         for start_time_utc, end_time_utc in possible_slots:
-            # Convert to participant's timezone
-            local_start = start_time_utc.astimezone(tz)
-            
-            date_str = local_start.strftime('%Y-%m-%d')
-            time_str = local_start.strftime('%H:%M')
-            
-            dates_set.add(date_str)
+            # Convert to participant's timezone; one strftime per slot,
+            # split into the date and time keys
+            date_str, time_str = start_time_utc.astimezone(tz).strftime(
+                '%Y-%m-%d %H:%M').split(' ')
+
             times_set.add(time_str)
-            
-            if date_str not in heatmap:
-                heatmap[date_str] = {}
-            
-            heatmap[date_str][time_str] = {
+
+            heatmap.setdefault(date_str, {})[time_str] = {
                 'level': 0,
                 'available': 0,
                 'total': 0,
@@ -222,11 +255,11 @@ def get_heatmap_data(meeting_request, participant_timezone='Asia/Ho_Chi_Minh'):
                 'start_utc': start_time_utc.isoformat(),
                 'end_utc': end_time_utc.isoformat(),
             }
-        
-        # Sort dates and times
-        dates = sorted(list(dates_set))
-        times = sorted(list(times_set))
-        
+
+        # Sort dates and times (heatmap keys double as the date set)
+        dates = sorted(heatmap)
+        times = sorted(times_set)
+
         return {
             'dates': dates,
             'time_slots': times,
@@ -234,36 +267,36 @@ def get_heatmap_data(meeting_request, participant_timezone='Asia/Ho_Chi_Minh'):
             'timezone': participant_timezone,
         }
     
-    # Organize data by date and time from suggested slots
+    # Organize data by date and time from suggested slots. Fetch plain
+    # tuples instead of model instances: the per-cell math is inlined via
+    # _availability_stats, so nothing in the loop needs the model layer.
     heatmap = {}
-    dates_set = set()
     times_set = set()
-    
-    for slot in slots:
-        # Convert to participant's timezone
-        local_start = slot.start_time.astimezone(tz)
-        
-        date_str = local_start.strftime('%Y-%m-%d')
-        time_str = local_start.strftime('%H:%M')
-        
-        dates_set.add(date_str)
+
+    slot_rows = slots.values_list(
+        'start_time', 'end_time', 'available_count', 'total_participants'
+    )
+    for start_time, end_time, available, total in slot_rows:
+        # One strftime per slot, split into the date and time keys
+        date_str, time_str = start_time.astimezone(tz).strftime(
+            '%Y-%m-%d %H:%M').split(' ')
+
         times_set.add(time_str)
-        
-        if date_str not in heatmap:
-            heatmap[date_str] = {}
-        
-        heatmap[date_str][time_str] = {
-            'level': slot.heatmap_level,
-            'available': slot.available_count,
-            'total': slot.total_participants,
-            'percentage': slot.availability_percentage,
-            'start_utc': slot.start_time.isoformat(),
-            'end_utc': slot.end_time.isoformat(),
+
+        level, percentage = _availability_stats(available, total)
+
+        heatmap.setdefault(date_str, {})[time_str] = {
+            'level': level,
+            'available': available,
+            'total': total,
+            'percentage': percentage,
+            'start_utc': start_time.isoformat(),
+            'end_utc': end_time.isoformat(),
         }
-    
-    # Sort dates and times
-    dates = sorted(list(dates_set))
-    times = sorted(list(times_set))
+
+    # Sort dates and times (heatmap keys double as the date set)
+    dates = sorted(heatmap)
+    times = sorted(times_set)
     
     return {
         'dates': dates,
@@ -281,7 +314,7 @@ def format_datetime_for_timezone(dt, timezone_str):
     if dt.tzinfo is None:
         dt = pytz.UTC.localize(dt)
     
-    tz = pytz.timezone(timezone_str)
+    tz = _get_timezone(timezone_str)
     local_dt = dt.astimezone(tz)
     
     return local_dt.strftime('%Y-%m-%d %H:%M')
@@ -294,31 +327,41 @@ def parse_busy_slots_from_json(json_data, participant_timezone):
     
     Returns: List of (start_datetime_utc, end_datetime_utc) tuples
     """
-    tz = pytz.timezone(participant_timezone)
+    tz = _get_timezone(participant_timezone)
     slots = []
-    
+
+    # Bound once outside the loop: large batches from the frontend hit
+    # these on every iteration.
+    fromiso = datetime.fromisoformat
+    append = slots.append
+
     for slot_data in json_data:
         # Parse datetime strings
         start_str = slot_data.get('start')
         end_str = slot_data.get('end')
-        
+
         if not start_str or not end_str:
             continue
-        
-        # Parse and localize
-        start_dt = datetime.fromisoformat(start_str.replace('Z', '+00:00'))
-        end_dt = datetime.fromisoformat(end_str.replace('Z', '+00:00'))
-        
+
+        # Parse with the C fromisoformat fast path; only rewrite a
+        # trailing 'Z' suffix instead of scanning the whole string
+        if start_str.endswith('Z'):
+            start_str = start_str[:-1] + '+00:00'
+        if end_str.endswith('Z'):
+            end_str = end_str[:-1] + '+00:00'
+        start_dt = fromiso(start_str)
+        end_dt = fromiso(end_str)
+
         # If naive, assume participant's timezone
         if start_dt.tzinfo is None:
             start_dt = tz.localize(start_dt)
         if end_dt.tzinfo is None:
             end_dt = tz.localize(end_dt)
-        
+
         # Convert to UTC
-        slots.append((
+        append((
             start_dt.astimezone(pytz.UTC),
             end_dt.astimezone(pytz.UTC)
         ))
-    
+
     return slots
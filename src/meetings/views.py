@@ -30,7 +30,11 @@ from .utils import (
     generate_suggested_slots, get_top_suggestions, get_heatmap_data,
     parse_busy_slots_from_json
 )
-from .email_utils import send_verification_email, send_meeting_invitation_email, send_meeting_locked_notification, send_password_reset_email
+from .email_utils import (
+    send_verification_email,
+    send_meeting_locked_notification, send_password_reset_email,
+    send_emails_batch_via_resend, build_meeting_invitation_message
+)
 
 
 def get_or_create_creator_id(request):
@@ -509,7 +513,11 @@ def lock_slot(request, request_id, slot_id):  # pragma: no cover
     meeting_request.save()
     
     # Send notification emails to all participants
-    participants_with_email = meeting_request.participants.exclude(email__isnull=True).exclude(email='')
+    # select_related keeps the email templates from re-querying the parent
+    # meeting request once per participant
+    participants_with_email = meeting_request.participants.select_related(
+        'meeting_request'
+    ).exclude(email__isnull=True).exclude(email='')
     sent_count = 0
     for participant in participants_with_email:
         if send_meeting_locked_notification(participant, meeting_request, slot):
@@ -1140,22 +1148,26 @@ def send_meeting_invitations(request, request_id):  # pragma: no cover
         return HttpResponseForbidden('You do not have permission to send invitations')
     
     # Get all participants with email addresses
-    participants_with_email = meeting_request.participants.exclude(email__isnull=True).exclude(email='')
-    
-    sent_count = 0
-    failed_count = 0
-    
+    # select_related so per-participant template rendering never lazily
+    # refetches the meeting request (classic N+1)
+    participants_with_email = meeting_request.participants.select_related(
+        'meeting_request'
+    ).exclude(email__isnull=True).exclude(email='')
+    
+    # Render all invitations locally, then hand them to Resend in one
+    # batch call instead of one HTTP round-trip per participant
+    invitation_messages = []
     for participant in participants_with_email:
         # Build respond URL with token and participant ID
         respond_url = request.build_absolute_uri(
             f'/r/{meeting_request.id}/?t={meeting_request.token}&p={participant.id}'
         )
-        
-        # Send invitation email
-        if send_meeting_invitation_email(participant, meeting_request, respond_url):
-            sent_count += 1
-        else:
-            failed_count += 1
+        message = build_meeting_invitation_message(participant, meeting_request, respond_url)
+        if message:
+            invitation_messages.append(message)
+    
+    sent_count = send_emails_batch_via_resend(invitation_messages)
+    failed_count = len(invitation_messages) - sent_count
     
     if sent_count > 0:
         messages.success(request, f'Đã gửi lời mời đến {sent_count} người tham gia.')
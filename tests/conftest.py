@@ -1,9 +1,20 @@
 """
 Pytest configuration and shared fixtures for testing time slot calculations
 """
+import functools
+import itertools
 import pytest
 import pytz
-from datetime import datetime, date, time, timedelta
+from unittest.mock import create_autospec
+
+# Memoize pytz.timezone for the whole test process. pytz keeps its own
+# tzinfo cache, but still re-runs name normalization and validation on
+# every call; the LRU wrapper turns repeat lookups into a dict hit.
+# Installed at conftest import so application code under test benefits too.
+if not hasattr(pytz.timezone, 'cache_info'):  # guard against double-wrapping on re-import
+    pytz.timezone = functools.lru_cache(maxsize=128)(pytz.timezone)
+from dataclasses import dataclass
+from datetime import datetime, date, time, timedelta, timezone as dt_timezone
 from django.utils import timezone
 from meetings.models import MeetingRequest, Participant, BusySlot, SuggestedSlot
 
@@ -14,14 +25,156 @@ def utc():
     return pytz.UTC
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def create_utc_datetime():
-    """Helper to create UTC datetime quickly"""
+    """Helper to create UTC datetime quickly (session-scoped, no DB access)"""
     def _create(year=2024, month=1, day=1, hour=9, minute=0, second=0):
-        return pytz.UTC.localize(datetime(year, month, day, hour, minute, second))
+        # stdlib UTC: a plain struct build, no pytz localize() machinery
+        return datetime(year, month, day, hour, minute, second, tzinfo=dt_timezone.utc)
     return _create
 
 
+@pytest.fixture(scope="session")
+def _resend_emails_proto():
+    """Autospec resend.Emails once per session; speccing walks the class"""
+    import resend
+    return create_autospec(resend.Emails, spec_set=True)
+
+
+@pytest.fixture(scope="session")
+def _resend_batch_proto():
+    """Autospec resend.Batch once per session; speccing walks the class"""
+    import resend
+    return create_autospec(resend.Batch, spec_set=True)
+
+
+@pytest.fixture
+def mock_resend_batch(_resend_batch_proto, monkeypatch):
+    """
+    Install the session-cached resend.Batch mock for one test.
+    Same reset-and-reconfigure pattern as mock_resend_emails below.
+    """
+    m = _resend_batch_proto
+    m.reset_mock(return_value=True, side_effect=True)
+    m.send.return_value = {'data': [{'id': 'email-123'}]}
+    monkeypatch.setattr('resend.Batch', m)
+    return m
+
+
+@pytest.fixture
+def mock_resend_emails(_resend_emails_proto, monkeypatch):
+    """
+    Install the session-cached resend.Emails mock for one test.
+    The prototype is reset and reconfigured rather than copied:
+    copy.copy on a Mock shares its child mocks, so a reset is both
+    cheaper and actually isolating.
+    """
+    m = _resend_emails_proto
+    m.reset_mock(return_value=True, side_effect=True)
+    m.send.return_value = {'id': 'email-123'}
+    monkeypatch.setattr('resend.Emails', m)
+    return m
+
+
+@pytest.fixture
+def resend_configured(settings):
+    """Point Resend at test credentials via the settings fixture"""
+    settings.RESEND_API_KEY = 'test-api-key'
+    settings.DEFAULT_FROM_EMAIL = 'from@test.com'
+
+
+@pytest.fixture
+def no_api_key(settings):
+    """Clear the Resend API key to exercise the unconfigured branch"""
+    settings.RESEND_API_KEY = None
+
+
+@pytest.fixture(scope="session")
+def verified_user(django_db_setup, django_db_blocker):
+    """
+    A user created once per session for tests that only read user attributes
+    (e.g. the email helpers). Committed outside the per-test transaction, so
+    tests must treat it as read-only. The username is deliberately unique to
+    this fixture to avoid colliding with per-test 'testuser' rows.
+    """
+    from django.contrib.auth.models import User
+    with django_db_blocker.unblock():
+        user, _ = User.objects.get_or_create(
+            username='session_user',
+            defaults={'email': 'test@example.com'},
+        )
+    return user
+
+
+@pytest.fixture(scope="session")
+def _profile_user(django_db_setup, django_db_blocker):
+    """User (plus signal-created profile) committed once per session.
+
+    Shared by the user-profile test modules, which only exercise the
+    profile token methods. Nothing here ever authenticates, so the
+    password is unusable — no hashing at all — and the username is
+    unique to this fixture to avoid colliding with per-test rows
+    elsewhere in the suite.
+    """
+    from django.contrib.auth.models import User
+    with django_db_blocker.unblock():
+        user = User.objects.filter(username='profile_module_user').first()
+        if user is None:
+            user = User(username='profile_module_user', email='test@example.com')
+            user.set_unusable_password()
+            user.save()
+    return user
+
+
+@pytest.fixture(scope="session")
+def _profile_user2(django_db_setup, django_db_blocker):
+    """Second session-committed user for cross-profile uniqueness checks"""
+    from django.contrib.auth.models import User
+    with django_db_blocker.unblock():
+        user = User.objects.filter(username='profile_module_user2').first()
+        if user is None:
+            user = User(username='profile_module_user2', email='test2@example.com')
+            user.set_unusable_password()
+            user.save()
+    return user
+
+
+@pytest.fixture
+def test_user(db, _profile_user):
+    """Fresh instance of the shared profile user for each test.
+
+    Re-fetching drops the cached profile object, so in-memory token
+    mutations from one test never leak into the next; the DB-side
+    mutations roll back with the per-test transaction.
+    """
+    from django.contrib.auth.models import User
+    return User.objects.get(pk=_profile_user.pk)
+
+
+@pytest.fixture
+def test_user2(db, _profile_user2):
+    """Fresh instance of the second shared profile user for each test"""
+    from django.contrib.auth.models import User
+    return User.objects.get(pk=_profile_user2.pk)
+
+
+@pytest.fixture(scope="session")
+def shared_meeting(django_db_setup, django_db_blocker):
+    """
+    MeetingRequest committed once per session for tests that only need a
+    default instance to read from or hang FK rows off. Committed outside
+    the per-test transaction, so tests must treat it as read-only; the
+    title is unique to this fixture so per-test 'Test Meeting' rows never
+    collide with it.
+    """
+    with django_db_blocker.unblock():
+        defaults = {k: v for k, v in MEETING_REQUEST_DEFAULTS.items()
+                    if k != 'title'}
+        meeting, _ = MeetingRequest.objects.get_or_create(
+            title='Session Meeting', defaults=defaults)
+    return meeting
+
+
 @pytest.fixture
 def sample_meeting_request(db):
     """
@@ -43,26 +196,38 @@ def sample_meeting_request(db):
     )
 
 
+# Copy-on-write defaults for create_meeting_request: built once at import,
+# copied per call instead of re-constructing the literals for every test.
+MEETING_REQUEST_DEFAULTS = {
+    'title': 'Test Meeting',
+    'duration_minutes': 60,
+    'timezone': 'UTC',
+    'date_range_start': date(2024, 1, 1),
+    'date_range_end': date(2024, 1, 1),
+    'work_hours_start': time(9, 0),
+    'work_hours_end': time(17, 0),
+    'step_size_minutes': 30,
+    'work_days_only': True,
+    'status': 'active',
+}
+
+
 @pytest.fixture
 def create_meeting_request(db):
     """
     Factory fixture to create customized meeting requests
+
+    Pass save=False for tests that only read attributes or properties:
+    the instance is built in memory and the INSERT (plus the token
+    generation done in save()) is skipped entirely.
     """
-    def _create(**kwargs):
-        defaults = {
-            'title': 'Test Meeting',
-            'duration_minutes': 60,
-            'timezone': 'UTC',
-            'date_range_start': date(2024, 1, 1),
-            'date_range_end': date(2024, 1, 1),
-            'work_hours_start': time(9, 0),
-            'work_hours_end': time(17, 0),
-            'step_size_minutes': 30,
-            'work_days_only': True,
-            'status': 'active'
-        }
+    def _create(save=True, **kwargs):
+        defaults = MEETING_REQUEST_DEFAULTS.copy()
         defaults.update(kwargs)
-        return MeetingRequest.objects.create(**defaults)
+        meeting = MeetingRequest(**defaults)
+        if save:
+            meeting.save()
+        return meeting
     return _create
 
 
@@ -71,10 +236,12 @@ def create_participant(db):
     """
     Factory fixture to create participants
     """
+    counter = itertools.count()
+
     def _create(meeting_request, **kwargs):
         defaults = {
             'name': 'Test Participant',
-            'email': f'participant{Participant.objects.count()}@test.com',
+            'email': f'participant{next(counter)}@test.com',
             'timezone': 'UTC',
             'has_responded': False
         }
@@ -128,7 +295,8 @@ def create_suggested_slot(db):
 @pytest.fixture
 def create_participants_bulk(db):
     """Factory to create multiple participants efficiently using bulk_create"""
-    def _create(meeting_request, count, has_responded=True, email_prefix='participant', **kwargs):
+    def _create(meeting_request, count, has_responded=True, email_prefix='participant',
+                batch_size=500, **kwargs):
         participants = [
             Participant(
                 meeting_request=meeting_request,
@@ -138,14 +306,14 @@ def create_participants_bulk(db):
                 timezone=kwargs.get('timezone', 'UTC')
             ) for i in range(count)
         ]
-        return Participant.objects.bulk_create(participants)
+        return Participant.objects.bulk_create(participants, batch_size=batch_size)
     return _create
 
 
 @pytest.fixture
 def create_busy_slots_bulk(db):
     """Factory to create multiple busy slots efficiently using bulk_create"""
-    def _create(participants, start_time, end_time, **kwargs):
+    def _create(participants, start_time, end_time, batch_size=500, **kwargs):
         busy_slots = [
             BusySlot(
                 participant=p,
@@ -154,22 +322,37 @@ def create_busy_slots_bulk(db):
                 description=kwargs.get('description', 'Busy')
             ) for p in participants
         ]
-        return BusySlot.objects.bulk_create(busy_slots)
+        return BusySlot.objects.bulk_create(busy_slots, batch_size=batch_size)
     return _create
 
 
-@pytest.fixture
+@dataclass(frozen=True)
+class TestDates:
+    """Immutable bundle of pre-calculated dates shared across the session"""
+    yesterday: date
+    today: date
+    tomorrow: date
+    next_week: date
+    next_month: date
+    far_future: date
+
+
+@pytest.fixture(scope="session")
 def test_dates():
-    """Pre-calculated dates for testing to avoid repeated date calculations"""
+    """Pre-calculated dates for testing to avoid repeated date calculations
+
+    Session-scoped and frozen: timezone.now() and the timedelta arithmetic
+    run once for the whole suite, and no test can mutate the shared dates.
+    """
     now = timezone.now()
-    return {
-        'yesterday': (now - timedelta(days=1)).date(),
-        'today': now.date(),
-        'tomorrow': (now + timedelta(days=1)).date(),
-        'next_week': (now + timedelta(days=7)).date(),
-        'next_month': (now + timedelta(days=30)).date(),
-        'far_future': (now + timedelta(days=100)).date(),
-    }
+    return TestDates(
+        yesterday=(now - timedelta(days=1)).date(),
+        today=now.date(),
+        tomorrow=(now + timedelta(days=1)).date(),
+        next_week=(now + timedelta(days=7)).date(),
+        next_month=(now + timedelta(days=30)).date(),
+        far_future=(now + timedelta(days=100)).date(),
+    )
 
 
 
@@ -3,76 +3,88 @@ Unit tests for email_utils.py
 Tests for email sending functions with mocked Resend API
 """
 import pytest
-from unittest.mock import patch, Mock, MagicMock
-from django.contrib.auth.models import User
-from django.template.loader import render_to_string
+from unittest.mock import patch
 
 from meetings.email_utils import (
     send_email_via_resend,
+    send_emails_batch_via_resend,
     send_verification_email,
     send_meeting_invitation_email,
     send_meeting_locked_notification,
     send_password_reset_email
 )
-from meetings.models import MeetingRequest, Participant, SuggestedSlot
-from datetime import date, time
 
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
+@pytest.fixture(scope="module", autouse=True)
+def _email_mocks():
+    """
+    Patch render_to_string/send_email_via_resend once for the whole module.
+    Per-test fixtures below only reconfigure return_value/side_effect,
+    avoiding repeated patch/unpatch overhead for every test.
+    """
+    render_patcher = patch('meetings.email_utils.render_to_string')
+    send_patcher = patch('meetings.email_utils.send_email_via_resend')
+    mocks = {'render': render_patcher.start(), 'send': send_patcher.start()}
+    yield mocks
+    send_patcher.stop()
+    render_patcher.stop()
+
+
+def _reset_email_mocks(mocks):
+    mocks['render'].reset_mock(return_value=True, side_effect=True)
+    mocks['send'].reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
-def mock_email_success():
+def mock_email_success(_email_mocks):
     """Mock successful email sending"""
-    with patch('meetings.email_utils.render_to_string') as mock_render, \
-         patch('meetings.email_utils.send_email_via_resend') as mock_send:
-        mock_render.return_value = '<p>Test email</p>'
-        mock_send.return_value = True
-        yield {'render': mock_render, 'send': mock_send}
+    _email_mocks['render'].return_value = '<p>Test email</p>'
+    _email_mocks['send'].return_value = True
+    yield _email_mocks
+    _reset_email_mocks(_email_mocks)
 
 
 @pytest.fixture
-def mock_email_failure():
+def mock_email_failure(_email_mocks):
     """Mock failed email sending"""
-    with patch('meetings.email_utils.render_to_string') as mock_render, \
-         patch('meetings.email_utils.send_email_via_resend') as mock_send:
-        mock_render.return_value = '<p>Test email</p>'
-        mock_send.return_value = False
-        yield {'render': mock_render, 'send': mock_send}
+    _email_mocks['render'].return_value = '<p>Test email</p>'
+    _email_mocks['send'].return_value = False
+    yield _email_mocks
+    _reset_email_mocks(_email_mocks)
 
 
 @pytest.fixture
-def mock_template_error():
+def mock_template_error(_email_mocks):
     """Mock template rendering error"""
-    with patch('meetings.email_utils.render_to_string') as mock_render, \
-         patch('meetings.email_utils.send_email_via_resend') as mock_send:
-        mock_render.side_effect = Exception('Template error')
-        yield {'render': mock_render, 'send': mock_send}
+    _email_mocks['render'].side_effect = Exception('Template error')
+    yield _email_mocks
+    _reset_email_mocks(_email_mocks)
 
 
 @pytest.fixture
-def test_user(db):
-    """Create a test user"""
-    return User.objects.create_user(
-        username='testuser',
-        email='test@example.com',
-        password='testpass123'
-    )
+def test_user(verified_user):
+    """Session-created user; the email helpers only read its attributes"""
+    return verified_user
 
 
 # =============================================================================
 # send_email_via_resend Tests
 # =============================================================================
 
+@pytest.mark.no_db
 class TestSendEmailViaResend:
-    """Tests for send_email_via_resend() function"""
-    
-    @patch('meetings.email_utils.settings')
-    def test_api_key_not_configured(self, mock_settings):
+    """Tests for send_email_via_resend() function
+
+    Purely mocked: these tests must not request the db fixture, so they
+    skip the per-test transaction begin/rollback entirely.
+    """
+
+    def test_api_key_not_configured(self, no_api_key):
         """Test behavior when API key is not configured"""
-        mock_settings.RESEND_API_KEY = None
-        
         result = send_email_via_resend(
             to_email='user@example.com',
             subject='Test',
@@ -82,6 +94,31 @@ class TestSendEmailViaResend:
         assert result is False
 
 
+# =============================================================================
+# send_emails_batch_via_resend Tests
+# =============================================================================
+
+@pytest.mark.no_db
+class TestSendEmailsBatchViaResend:
+    """Tests for send_emails_batch_via_resend() function
+
+    The full API-level coverage (chunking, recipient normalization,
+    failure paths) lives in test_email_utils_extended.py.
+    """
+
+    def test_empty_messages(self):
+        """Test that an empty batch sends nothing and reports zero"""
+        assert send_emails_batch_via_resend([]) == 0
+
+    def test_api_key_not_configured(self, no_api_key):
+        """Test behavior when API key is not configured"""
+        result = send_emails_batch_via_resend(
+            [{'to': 'user@example.com', 'subject': 'Test', 'html': '<p>Test</p>'}]
+        )
+
+        assert result == 0
+
+
 # =============================================================================
 # send_verification_email Tests
 # =============================================================================
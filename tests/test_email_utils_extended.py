@@ -3,42 +3,59 @@ Extended unit tests for email_utils.py
 Tests email sending functionality using Resend API
 """
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
 from django.contrib.auth.models import User
 from meetings.email_utils import (
+    RESEND_BATCH_LIMIT,
     send_email_via_resend,
+    send_emails_batch_via_resend,
+    build_meeting_invitation_message,
     send_verification_email,
     send_meeting_invitation_email,
     send_meeting_locked_notification,
     send_password_reset_email
 )
 from meetings.models import MeetingRequest, Participant, SuggestedSlot
-from datetime import datetime, date, time
-import pytz
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _fake_render():
+    """
+    Replace template rendering with a stub for the whole module.
+    No test here inspects the rendered HTML, so the real template
+    engine run per test is pure overhead. Installed once via
+    patcher.start() instead of per-test patch/unpatch.
+    """
+    patcher = patch('meetings.email_utils.render_to_string',
+                    return_value='<p>Test email</p>')
+    patcher.start()
+    yield
+    patcher.stop()
 
 
 @pytest.mark.django_db
 class TestSendEmailViaResend:
     """Test cases for send_email_via_resend function"""
     
-    @patch('meetings.email_utils.settings.RESEND_API_KEY', 'test-api-key')
-    @patch('meetings.email_utils.settings.DEFAULT_FROM_EMAIL', 'from@test.com')
-    def test_successful_email_send(self):
-        """Test successful email send via Resend"""
-        # Since resend is imported inside the function, we need to mock it there
-        with patch('resend.Emails') as mock_emails:
-            mock_emails.send.return_value = {'id': 'email-123'}
-            
-            result = send_email_via_resend(
-                to_email='test@example.com',
-                subject='Test Subject',
-                html_content='<p>Test Content</p>'
-            )
-            
-            assert result is True
+    @pytest.mark.parametrize("to_email,subject,html_content", [
+        pytest.param('test@example.com', 'Test Subject', '<p>Test Content</p>',
+                     id='single-recipient'),
+        pytest.param(['test1@example.com', 'test2@example.com'], 'Test', '<p>Test</p>',
+                     id='multiple-recipients'),
+        pytest.param('test@example.com', '', '<p>Test</p>', id='empty-subject'),
+        pytest.param('test@example.com', 'Test', '', id='empty-content'),
+    ])
+    def test_send(self, resend_configured, mock_resend_emails, to_email, subject, html_content):
+        """Test that valid sends succeed regardless of recipient/subject/content shape"""
+        result = send_email_via_resend(
+            to_email=to_email,
+            subject=subject,
+            html_content=html_content
+        )
+        
+        assert result is True
     
-    @patch('meetings.email_utils.settings.RESEND_API_KEY', None)
-    def test_no_api_key_configured(self, caplog):
+    def test_no_api_key_configured(self, no_api_key, caplog):
         """Test when no API key is configured"""
         result = send_email_via_resend(
             to_email='test@example.com',
@@ -49,104 +66,173 @@ class TestSendEmailViaResend:
         assert result is False
         assert 'RESEND_API_KEY not configured' in caplog.text
     
-    @patch('meetings.email_utils.settings.RESEND_API_KEY', 'test-api-key')
-    @patch('meetings.email_utils.settings.DEFAULT_FROM_EMAIL', 'from@test.com')
-    def test_multiple_recipients(self):
-        """Test sending email to multiple recipients"""
-        with patch('resend.Emails') as mock_emails:
-            mock_emails.send.return_value = {'id': 'email-123'}
-            
-            result = send_email_via_resend(
-                to_email=['test1@example.com', 'test2@example.com'],
-                subject='Test',
-                html_content='<p>Test</p>'
-            )
-            
-            assert result is True
-    
-    @patch('meetings.email_utils.settings.RESEND_API_KEY', 'test-api-key')
-    def test_empty_subject(self):
-        """Test sending email with empty subject"""
-        with patch('resend.Emails') as mock_emails:
-            mock_emails.send.return_value = {'id': 'email-123'}
-            
-            result = send_email_via_resend(
-                to_email='test@example.com',
-                subject='',
-                html_content='<p>Test</p>'
-            )
-            
-            # Should still send
-            assert result is True
-    
-    @patch('meetings.email_utils.settings.RESEND_API_KEY', 'test-api-key')
-    def test_empty_content(self):
-        """Test sending email with empty content"""
-        with patch('resend.Emails') as mock_emails:
-            mock_emails.send.return_value = {'id': 'email-123'}
-            
-            result = send_email_via_resend(
-                to_email='test@example.com',
-                subject='Test',
-                html_content=''
-            )
-            
-            # Should still send
-            assert result is True
-    
-    @patch('meetings.email_utils.settings.RESEND_API_KEY', 'test-api-key')
-    def test_resend_api_exception(self, caplog):
+    def test_resend_api_exception(self, resend_configured, caplog, mock_resend_emails):
+        """Test handling Resend API exception"""
+        mock_resend_emails.send.side_effect = Exception('API Error')
+        
+        result = send_email_via_resend(
+            to_email='test@example.com',
+            subject='Test',
+            html_content='<p>Test</p>'
+        )
+        
+        assert result is False
+        assert 'Failed to send email' in caplog.text
+
+
+def _batch_messages(count=1):
+    """Build minimal message dicts for the batch-send tests"""
+    return [
+        {'to': f'user{i}@test.com', 'subject': 'Test', 'html': '<p>Test</p>'}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.no_db
+class TestSendEmailsBatchViaResend:
+    """Test cases for send_emails_batch_via_resend function"""
+
+    def test_empty_messages(self):
+        """Test that an empty batch short-circuits without touching the API"""
+        assert send_emails_batch_via_resend([]) == 0
+
+    def test_no_api_key_configured(self, no_api_key, caplog):
+        """Test when no API key is configured"""
+        result = send_emails_batch_via_resend(_batch_messages(2))
+
+        assert result == 0
+        assert 'RESEND_API_KEY not configured' in caplog.text
+
+    def test_single_batch(self, resend_configured, mock_resend_batch):
+        """Test that one under-limit batch goes out in a single API call"""
+        result = send_emails_batch_via_resend(_batch_messages(3))
+
+        assert result == 3
+        mock_resend_batch.send.assert_called_once()
+        params = mock_resend_batch.send.call_args[0][0]
+        # String recipients are normalized to single-element lists
+        assert [p['to'] for p in params] == [
+            ['user0@test.com'], ['user1@test.com'], ['user2@test.com']]
+        assert all(p['from'] == 'from@test.com' for p in params)
+
+    def test_list_recipient_passed_through(self, resend_configured, mock_resend_batch):
+        """Test that list recipients are forwarded unchanged"""
+        messages = [{'to': ['a@test.com', 'b@test.com'],
+                     'subject': 'Test', 'html': '<p>Test</p>'}]
+
+        assert send_emails_batch_via_resend(messages) == 1
+        params = mock_resend_batch.send.call_args[0][0]
+        assert params[0]['to'] == ['a@test.com', 'b@test.com']
+
+    def test_explicit_from_email(self, resend_configured, mock_resend_batch):
+        """Test that an explicit sender overrides DEFAULT_FROM_EMAIL"""
+        send_emails_batch_via_resend(_batch_messages(), from_email='custom@test.com')
+
+        params = mock_resend_batch.send.call_args[0][0]
+        assert params[0]['from'] == 'custom@test.com'
+
+    def test_chunks_at_batch_limit(self, resend_configured, mock_resend_batch):
+        """Test that oversized batches are split at the API's 100-message cap"""
+        result = send_emails_batch_via_resend(
+            _batch_messages(2 * RESEND_BATCH_LIMIT + 50))
+
+        assert result == 2 * RESEND_BATCH_LIMIT + 50
+        sizes = [len(c.args[0]) for c in mock_resend_batch.send.call_args_list]
+        assert sizes == [RESEND_BATCH_LIMIT, RESEND_BATCH_LIMIT, 50]
+
+    def test_failed_chunk_keeps_other_chunks(self, resend_configured,
+                                             mock_resend_batch, caplog):
+        """Test that one failing chunk only loses its own messages"""
+        mock_resend_batch.send.side_effect = [
+            {'data': []}, Exception('API Error'), {'data': []}]
+
+        result = send_emails_batch_via_resend(
+            _batch_messages(2 * RESEND_BATCH_LIMIT + 50))
+
+        assert result == RESEND_BATCH_LIMIT + 50
+        assert 'Failed to send batch email' in caplog.text
+
+    def test_resend_api_exception(self, resend_configured, caplog, mock_resend_batch):
         """Test handling Resend API exception"""
-        with patch('resend.Emails') as mock_emails:
-            mock_emails.send.side_effect = Exception('API Error')
-            
-            result = send_email_via_resend(
-                to_email='test@example.com',
-                subject='Test',
-                html_content='<p>Test</p>'
-            )
-            
-            assert result is False
-            assert 'Failed to send email' in caplog.text
+        mock_resend_batch.send.side_effect = Exception('API Error')
+
+        result = send_emails_batch_via_resend(_batch_messages(2))
+
+        assert result == 0
+        assert 'Failed to send batch email' in caplog.text
+
+
+@pytest.mark.no_db
+class TestBuildMeetingInvitationMessage:
+    """Test cases for build_meeting_invitation_message function
+
+    Pure message assembly on unsaved instances; rendering is stubbed by
+    the module-wide _fake_render fixture.
+    """
+
+    def test_participant_with_email(self):
+        """Test message dict assembly for an emailable participant"""
+        participant = Participant(name='Invitee', email='invitee@test.com')
+        meeting = MeetingRequest(title='Test Meeting')
+
+        message = build_meeting_invitation_message(
+            participant, meeting, 'http://example.com/r/1')
+
+        assert message == {
+            'to': 'invitee@test.com',
+            'subject': 'Mời tham gia cuộc họp: Test Meeting',
+            'html': '<p>Test email</p>',
+        }
+
+    def test_participant_without_email(self):
+        """Test that participants without an email yield no message"""
+        participant = Participant(name='No Email', email='')
+        meeting = MeetingRequest(title='Test Meeting')
+
+        assert build_meeting_invitation_message(
+            participant, meeting, 'http://example.com/r/1') is None
 
 
 @pytest.mark.django_db
-class TestSendVerificationEmail:
-    """Test cases for send_verification_email function"""
-    
+class TestUserEmailHelpers:
+    """Shared cases for send_verification_email / send_password_reset_email
+
+    Both helpers have the same shape (user + URL kwarg), so their
+    duplicated success and no-email tests are parametrized over the pair.
+    """
+
+    USER_EMAIL_CASES = [
+        pytest.param(send_verification_email, 'verification_url', 'xác thực email',
+                     id='verification'),
+        pytest.param(send_password_reset_email, 'reset_url', 'mật khẩu',
+                     id='password-reset'),
+    ]
+
+    @pytest.mark.parametrize("send_fn,url_kwarg,subject_fragment", USER_EMAIL_CASES)
     @patch('meetings.email_utils.send_email_via_resend')
-    def test_successful_verification_email(self, mock_send):
-        """Test successful verification email send"""
+    def test_successful_send(self, mock_send, verified_user,
+                             send_fn, url_kwarg, subject_fragment):
+        """Test successful send for both user-facing email helpers"""
         mock_send.return_value = True
         
-        user = User.objects.create(
-            username='testuser',
-            email='test@example.com'
-        )
-        
-        result = send_verification_email(
-            user=user,
-            verification_url='http://example.com/verify/token123'
-        )
+        result = send_fn(verified_user, **{url_kwarg: 'http://example.com/x/token123'})
         
         assert result is True
         mock_send.assert_called_once()
         args, kwargs = mock_send.call_args
         assert kwargs['to_email'] == 'test@example.com'
-        assert 'Xác thực email' in kwargs['subject']
+        assert subject_fragment in kwargs['subject'].lower()
     
+    @pytest.mark.parametrize("send_fn,url_kwarg,subject_fragment", USER_EMAIL_CASES)
     @patch('meetings.email_utils.send_email_via_resend')
-    def test_user_with_no_email(self, mock_send):
-        """Test verification email when user has no email"""
+    def test_user_with_no_email(self, mock_send, send_fn, url_kwarg, subject_fragment):
+        """Test helpers still attempt the send when the user has no email"""
         user = User.objects.create(
             username='testuser',
             email=''
         )
         
-        result = send_verification_email(
-            user=user,
-            verification_url='http://example.com/verify/token'
-        )
+        result = send_fn(user, **{url_kwarg: 'http://example.com/x/token'})
         
         # Should attempt to send but may fail
         assert mock_send.called
@@ -180,7 +266,9 @@ class TestSendMeetingInvitationEmail:
     def test_participant_without_email(self, create_meeting_request):
         """Test invitation when participant has no email"""
         meeting = create_meeting_request()
-        participant = Participant.objects.create(
+        # Unsaved instance: the helper short-circuits on email=None and
+        # never queries, so the INSERT would be pure waste
+        participant = Participant(
             meeting_request=meeting,
             email=None,
             name='Test Participant'
@@ -252,12 +340,14 @@ class TestSendMeetingLockedNotification:
     def test_participant_without_email(self, create_meeting_request, create_utc_datetime):
         """Test notification when participant has no email"""
         meeting = create_meeting_request()
-        participant = Participant.objects.create(
+        # Unsaved instances: the helper short-circuits on email=None and
+        # never queries either object back
+        participant = Participant(
             meeting_request=meeting,
             email=None,
             name='Test Participant'
         )
-        locked_slot = SuggestedSlot.objects.create(
+        locked_slot = SuggestedSlot(
             meeting_request=meeting,
             start_time=create_utc_datetime(2024, 1, 1, 9, 0),
             end_time=create_utc_datetime(2024, 1, 1, 10, 0),
@@ -275,57 +365,15 @@ class TestSendMeetingLockedNotification:
 
 @pytest.mark.django_db
 class TestSendPasswordResetEmail:
-    """Test cases for send_password_reset_email function"""
-    
-    @patch('meetings.email_utils.send_email_via_resend')
-    def test_successful_reset_email(self, mock_send):
-        """Test successful password reset email"""
-        mock_send.return_value = True
-        
-        user = User.objects.create(
-            username='testuser',
-            email='test@example.com'
-        )
-        
-        result = send_password_reset_email(
-            user=user,
-            reset_url='http://example.com/reset/token123'
-        )
-        
-        assert result is True
-        mock_send.assert_called_once()
-        args, kwargs = mock_send.call_args
-        assert kwargs['to_email'] == 'test@example.com'
-        assert 'mật khẩu' in kwargs['subject'].lower()
+    """Reset-specific cases; the shared ones live in TestUserEmailHelpers"""
     
     @patch('meetings.email_utils.send_email_via_resend')
-    def test_user_with_no_email(self, mock_send):
-        """Test password reset when user has no email"""
-        user = User.objects.create(
-            username='testuser',
-            email=''
-        )
-        
-        result = send_password_reset_email(
-            user=user,
-            reset_url='http://example.com/reset/token'
-        )
-        
-        # Should attempt to send
-        assert mock_send.called
-    
-    @patch('meetings.email_utils.send_email_via_resend')
-    def test_invalid_reset_url(self, mock_send):
+    def test_invalid_reset_url(self, mock_send, verified_user):
         """Test password reset with invalid URL"""
         mock_send.return_value = True
         
-        user = User.objects.create(
-            username='testuser',
-            email='test@example.com'
-        )
-        
         result = send_password_reset_email(
-            user=user,
+            user=verified_user,
             reset_url=''
         )
         
@@ -3,16 +3,14 @@ Unit tests for forms.py
 Tests for form validation including UserRegistrationForm, MeetingRequestForm, and BusySlotForm
 """
 import pytest
-from datetime import date, time, timedelta
-from django.utils import timezone
-from django.core.exceptions import ValidationError
+import pytz
+from datetime import datetime, time, timedelta
 from django.contrib.auth.models import User
 
 from meetings.forms import (
     UserRegistrationForm,
     MeetingRequestForm,
-    BusySlotForm,
-    ParticipantForm
+    BusySlotForm
 )
 
 
@@ -20,6 +18,18 @@ from meetings.forms import (
 # Fixtures
 # =============================================================================
 
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin timezone.now() so date arithmetic is a single deterministic value
+
+    Avoids one real clock read per assertion and edge-of-midnight
+    flakiness in the relative-date validation tests.
+    """
+    t = datetime(2024, 6, 3, 12, 0, tzinfo=pytz.UTC)  # a Monday
+    monkeypatch.setattr('django.utils.timezone.now', lambda: t)
+    return t
+
+
 @pytest.fixture
 def base_form_data(test_dates):
     """Base form data with valid defaults for MeetingRequestForm"""
@@ -27,8 +37,8 @@ def base_form_data(test_dates):
         'title': 'Test Meeting',
         'duration_minutes': 60,
         'timezone': 'UTC',
-        'date_range_start': test_dates['tomorrow'],
-        'date_range_end': test_dates['next_week'],
+        'date_range_start': test_dates.tomorrow,
+        'date_range_end': test_dates.next_week,
         'work_hours_start': time(9, 0),
         'work_hours_end': time(17, 0),
         'step_size_minutes': 30,
@@ -57,11 +67,12 @@ class TestUserRegistrationFormCleanEmail:
     
     def test_duplicate_email(self, db):
         """Test that duplicate email raises ValidationError"""
-        # Create existing user
-        User.objects.create_user(
+        # Create existing user. Plain create(): the password is never
+        # checked, only the email uniqueness, so skip the hasher entirely.
+        User.objects.create(
             username='existing',
             email='existing@example.com',
-            password='testpass123'
+            password='x'
         )
         
         # Try to register with same email
@@ -73,7 +84,8 @@ class TestUserRegistrationFormCleanEmail:
         }
         form = UserRegistrationForm(data=form_data)
         assert not form.is_valid()
-        assert 'email' in form.errors
+        # as_data() exposes the raw ValidationErrors without rendering
+        assert 'email' in form.errors.as_data()
 
 
 # =============================================================================
@@ -91,7 +103,7 @@ class TestMeetingRequestFormClean:
         form = MeetingRequestForm(data=form_data)
         assert form.is_valid()
     
-    @pytest.mark.parametrize("start_offset,end_offset,should_be_valid,scenario", [
+    DATE_RANGE_CASES = [
         (1, 7, True, "Valid future range"),
         (1, 1, False, "Same day range (end must be after start)"),
         (-1, 1, False, "Start in past"),
@@ -99,17 +111,24 @@ class TestMeetingRequestFormClean:
         (-2, -1, False, "Both in past"),
         (7, 1, False, "End before start"),
         (1, 100, False, "Range > 90 days"),
-    ])
-    def test_date_range_validation(self, db, base_form_data, test_dates, 
-                                   start_offset, end_offset, should_be_valid, scenario):
-        """Test various date range validation scenarios"""
-        now = timezone.now()
-        form_data = base_form_data.copy()
-        form_data['date_range_start'] = (now + timedelta(days=start_offset)).date()
-        form_data['date_range_end'] = (now + timedelta(days=end_offset)).date()
-        
-        form = MeetingRequestForm(data=form_data)
-        assert form.is_valid() == should_be_valid, f"Failed: {scenario}"
+    ]
+
+    def test_date_range_validation(self, db, base_form_data, frozen_now):
+        """Test various date range validation scenarios
+
+        All cases run through one reused form instance: ModelForm
+        __init__ (field metadata introspection, widget setup) is paid
+        once instead of once per scenario.
+        """
+        form = MeetingRequestForm(data=base_form_data)
+        for start_offset, end_offset, should_be_valid, scenario in self.DATE_RANGE_CASES:
+            form.data = {
+                **base_form_data,
+                'date_range_start': (frozen_now + timedelta(days=start_offset)).date(),
+                'date_range_end': (frozen_now + timedelta(days=end_offset)).date(),
+            }
+            form._errors = None  # force the reused instance to re-validate
+            assert form.is_valid() == should_be_valid, f"Failed: {scenario}"
     
     def test_valid_work_hours(self, db, base_form_data):
         """Test that valid work hours pass validation"""
@@ -138,18 +157,18 @@ class TestMeetingRequestFormClean:
         form = MeetingRequestForm(data=form_data)
         assert not form.is_valid()
     
-    def test_response_deadline_in_past(self, db, base_form_data):
+    def test_response_deadline_in_past(self, db, base_form_data, frozen_now):
         """Test that response deadline in past raises ValidationError"""
         form_data = base_form_data.copy()
-        form_data['response_deadline'] = timezone.now() - timedelta(hours=1)
+        form_data['response_deadline'] = frozen_now - timedelta(hours=1)
         
         form = MeetingRequestForm(data=form_data)
         assert not form.is_valid()
     
-    def test_response_deadline_in_future(self, db, base_form_data):
+    def test_response_deadline_in_future(self, db, base_form_data, frozen_now):
         """Test that response deadline in future passes validation"""
         form_data = base_form_data.copy()
-        form_data['response_deadline'] = timezone.now() + timedelta(days=2)
+        form_data['response_deadline'] = frozen_now + timedelta(days=2)
         
         form = MeetingRequestForm(data=form_data)
         if not form.is_valid():
@@ -168,13 +187,18 @@ class TestMeetingRequestFormClean:
 # BusySlotForm Tests
 # =============================================================================
 
+@pytest.mark.no_db
 class TestBusySlotFormClean:
-    """Tests for BusySlotForm.clean() validation"""
+    """Tests for BusySlotForm.clean() validation
+
+    Pure validation: BusySlot has no unique constraints, so is_valid()
+    never queries and the db fixture is unnecessary.
+    """
     
-    def test_valid_time_range(self, db):
+    def test_valid_time_range(self, frozen_now):
         """Test that valid time range passes validation"""
-        start = timezone.now() + timedelta(hours=1)
-        end = timezone.now() + timedelta(hours=2)
+        start = frozen_now + timedelta(hours=1)
+        end = frozen_now + timedelta(hours=2)
         
         form_data = {
             'start_time': start,
@@ -184,10 +208,10 @@ class TestBusySlotFormClean:
         form = BusySlotForm(data=form_data)
         assert form.is_valid()
     
-    def test_invalid_time_range_end_before_start(self, db):
+    def test_invalid_time_range_end_before_start(self, frozen_now):
         """Test that end time before start time raises ValidationError"""
-        start = timezone.now() + timedelta(hours=2)
-        end = timezone.now() + timedelta(hours=1)
+        start = frozen_now + timedelta(hours=2)
+        end = frozen_now + timedelta(hours=1)
         
         form_data = {
             'start_time': start,
@@ -197,9 +221,9 @@ class TestBusySlotFormClean:
         form = BusySlotForm(data=form_data)
         assert not form.is_valid()
     
-    def test_times_equal(self, db):
+    def test_times_equal(self, frozen_now):
         """Test that equal start and end times raise ValidationError"""
-        same_time = timezone.now() + timedelta(hours=1)
+        same_time = frozen_now + timedelta(hours=1)
         
         form_data = {
             'start_time': same_time,
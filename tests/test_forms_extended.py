@@ -2,18 +2,63 @@
 Extended unit tests for forms.py
 Tests form validation and cleaning methods
 """
+import freezegun
 import pytest
-from datetime import date, time, timedelta
+from datetime import datetime, time, timedelta
+from types import MappingProxyType
 from django.utils import timezone
-from django.core.exceptions import ValidationError
 from django.contrib.auth.models import User
 from meetings.forms import (
     UserRegistrationForm,
     MeetingRequestForm,
     BusySlotForm
 )
-from meetings.models import MeetingRequest
-import pytz
+
+
+# One freeze point for the whole module: every timezone.now() read becomes a
+# constant instead of a clock syscall, and the relative-date cases can never
+# flake across a midnight boundary mid-run.
+FROZEN_TIME = '2024-06-15 12:00:00+00:00'
+
+
+@pytest.fixture(autouse=True, scope='module')
+def _frozen_time():
+    """Freeze timezone.now() at FROZEN_TIME for every test in this module"""
+    with freezegun.freeze_time(FROZEN_TIME) as ft:
+        yield ft
+
+
+# Shared, read-only base payload for MeetingRequestForm tests: built once at
+# import instead of re-allocating the same 11-field dict in every test.
+# Date fields are expressed as offsets and resolved against timezone.now()
+# inside the test, so the cases stay valid regardless of when they run.
+BASE_FORM_DATA = MappingProxyType({
+    'title': 'Test Meeting',
+    'duration_minutes': 60,
+    'timezone': 'UTC',
+    'work_hours_start': time(9, 0),
+    'work_hours_end': time(17, 0),
+    'step_size_minutes': 30,
+    'work_days_only': True,
+    'created_by_email': 'test@example.com',
+})
+
+
+@pytest.fixture(scope='module')
+def existing_email_user(django_db_setup, django_db_blocker):
+    """
+    User committed once per module for the duplicate-email checks.
+    Created outside the per-test transaction, so it must stay read-only;
+    username/email are unique to this fixture to avoid colliding with
+    per-test 'existing' rows elsewhere in the suite.
+    """
+    from django.contrib.auth.models import User
+    with django_db_blocker.unblock():
+        user, _ = User.objects.get_or_create(
+            username='existing_module',
+            defaults={'email': 'existing-module@test.com', 'password': 'x'},
+        )
+    return user
 
 
 @pytest.mark.django_db
@@ -33,25 +78,19 @@ class TestUserRegistrationFormCleanEmail:
         assert form.is_valid()
         assert form.cleaned_data['email'] == 'newuser@example.com'
     
-    def test_duplicate_email_invalid(self):
+    def test_duplicate_email_invalid(self, existing_email_user):
         """Test clean_email with duplicate email"""
-        # Create existing user
-        User.objects.create_user(
-            username='existing',
-            email='existing@example.com',
-            password='pass'
-        )
-        
         form_data = {
             'username': 'newuser',
-            'email': 'existing@example.com',
+            'email': existing_email_user.email,
             'password1': 'TestPass123!',
             'password2': 'TestPass123!'
         }
         form = UserRegistrationForm(data=form_data)
         
         assert not form.is_valid()
-        assert 'email' in form.errors
+        # as_data() exposes the raw ValidationErrors without rendering
+        assert 'email' in form.errors.as_data()
     
     def test_empty_email(self):
         """Test clean_email with empty email"""
@@ -66,245 +105,113 @@ class TestUserRegistrationFormCleanEmail:
         assert not form.is_valid()
 
 
-@pytest.mark.django_db
+@pytest.mark.no_db
 class TestMeetingRequestFormClean:
-    """Test cases for MeetingRequestForm.clean method"""
-    
-    def test_start_date_in_past(self):
-        """Test clean with start date in past"""
-        yesterday = (timezone.now() - timedelta(days=1)).date()
-        tomorrow = (timezone.now() + timedelta(days=1)).date()
-        
-        form_data = {
-            'title': 'Test Meeting',
-            'duration_minutes': 60,
-            'timezone': 'UTC',
-            'date_range_start': yesterday,
-            'date_range_end': tomorrow,
-            'work_hours_start': time(9, 0),
-            'work_hours_end': time(17, 0),
-            'step_size_minutes': 30,
-            'work_days_only': True,
-            'created_by_email': 'test@example.com'
-        }
-        form = MeetingRequestForm(data=form_data)
-        
-        assert not form.is_valid()
-        assert 'Ngày bắt đầu không được ở quá khứ' in str(form.errors)
-    
-    def test_end_date_in_past(self):
-        """Test clean with end date in past"""
-        yesterday = (timezone.now() - timedelta(days=1)).date()
-        tomorrow = (timezone.now() + timedelta(days=1)).date()
-        
-        form_data = {
-            'title': 'Test Meeting',
-            'duration_minutes': 60,
-            'timezone': 'UTC',
-            'date_range_start': tomorrow,
-            'date_range_end': yesterday,
-            'work_hours_start': time(9, 0),
-            'work_hours_end': time(17, 0),
-            'step_size_minutes': 30,
-            'work_days_only': True,
-            'created_by_email': 'test@example.com'
-        }
-        form = MeetingRequestForm(data=form_data)
-        
-        assert not form.is_valid()
-    
-    def test_end_date_before_start_date(self):
-        """Test clean with end date before start date"""
-        today = timezone.now().date()
-        
-        form_data = {
-            'title': 'Test Meeting',
-            'duration_minutes': 60,
-            'timezone': 'UTC',
-            'date_range_start': today + timedelta(days=10),
-            'date_range_end': today + timedelta(days=5),
-            'work_hours_start': time(9, 0),
-            'work_hours_end': time(17, 0),
-            'step_size_minutes': 30,
-            'work_days_only': True,
-            'created_by_email': 'test@example.com'
-        }
-        form = MeetingRequestForm(data=form_data)
-        
-        assert not form.is_valid()
-        assert 'Ngày kết thúc phải sau ngày bắt đầu' in str(form.errors)
-    
-    def test_date_range_exceeds_90_days(self):
-        """Test clean with date range > 90 days"""
-        today = timezone.now().date()
-        
-        form_data = {
-            'title': 'Test Meeting',
-            'duration_minutes': 60,
-            'timezone': 'UTC',
-            'date_range_start': today,
-            'date_range_end': today + timedelta(days=91),
-            'work_hours_start': time(9, 0),
-            'work_hours_end': time(17, 0),
-            'step_size_minutes': 30,
-            'work_days_only': True,
-            'created_by_email': 'test@example.com'
-        }
-        form = MeetingRequestForm(data=form_data)
-        
-        assert not form.is_valid()
-        assert '90 ngày' in str(form.errors)
-    
-    def test_response_deadline_in_past(self):
-        """Test clean with response deadline in past"""
-        today = timezone.now().date()
-        past_deadline = timezone.now() - timedelta(hours=1)
-        
-        form_data = {
-            'title': 'Test Meeting',
-            'duration_minutes': 60,
-            'timezone': 'UTC',
-            'date_range_start': today,
-            'date_range_end': today + timedelta(days=1),
-            'work_hours_start': time(9, 0),
-            'work_hours_end': time(17, 0),
-            'step_size_minutes': 30,
-            'work_days_only': True,
-            'response_deadline': past_deadline,
-            'created_by_email': 'test@example.com'
-        }
-        form = MeetingRequestForm(data=form_data)
-        
-        assert not form.is_valid()
-        assert 'Hạn chót trả lời không được ở quá khứ' in str(form.errors)
-    
-    def test_work_end_before_work_start(self):
-        """Test clean with work end before work start"""
-        today = timezone.now().date()
-        
-        form_data = {
-            'title': 'Test Meeting',
-            'duration_minutes': 60,
-            'timezone': 'UTC',
-            'date_range_start': today,
-            'date_range_end': today + timedelta(days=1),
-            'work_hours_start': time(17, 0),
-            'work_hours_end': time(9, 0),
-            'step_size_minutes': 30,
-            'work_days_only': True,
-            'created_by_email': 'test@example.com'
-        }
-        form = MeetingRequestForm(data=form_data)
-        
-        assert not form.is_valid()
-        assert 'Giờ kết thúc phải sau giờ bắt đầu' in str(form.errors)
-    
-    def test_valid_configuration(self):
-        """Test clean with valid configuration"""
-        today = timezone.now().date()
-        
-        form_data = {
-            'title': 'Test Meeting',
-            'duration_minutes': 60,
-            'timezone': 'UTC',
-            'date_range_start': today,
-            'date_range_end': today + timedelta(days=1),
-            'work_hours_start': time(9, 0),
-            'work_hours_end': time(17, 0),
-            'step_size_minutes': 30,
-            'work_days_only': True,
-            'created_by_email': 'test@example.com'
-        }
-        form = MeetingRequestForm(data=form_data)
-        
-        assert form.is_valid()
-    
-    def test_today_as_start_date_valid(self):
-        """Test clean with today as start date (valid)"""
-        today = timezone.now().date()
-        
-        form_data = {
-            'title': 'Test Meeting',
-            'duration_minutes': 60,
-            'timezone': 'UTC',
-            'date_range_start': today,
-            'date_range_end': today + timedelta(days=1),
-            'work_hours_start': time(9, 0),
-            'work_hours_end': time(17, 0),
-            'step_size_minutes': 30,
-            'work_days_only': True,
-            'created_by_email': 'test@example.com'
-        }
-        form = MeetingRequestForm(data=form_data)
-        
-        assert form.is_valid()
-    
-    def test_exactly_90_days_range(self):
-        """Test clean with exactly 90 days range"""
-        today = timezone.now().date()
-        
-        form_data = {
-            'title': 'Test Meeting',
-            'duration_minutes': 60,
-            'timezone': 'UTC',
-            'date_range_start': today,
-            'date_range_end': today + timedelta(days=90),
-            'work_hours_start': time(9, 0),
-            'work_hours_end': time(17, 0),
-            'step_size_minutes': 30,
-            'work_days_only': True,
-            'created_by_email': 'test@example.com'
-        }
+    """Test cases for MeetingRequestForm.clean method
+
+    Pure validation: none of the form's fields carry unique constraints,
+    so is_valid() never queries and the per-test transaction wrapper
+    would be pure overhead.
+    """
+
+    @pytest.mark.parametrize('overrides,valid,error', [
+        pytest.param(
+            {'start_days': 0, 'end_days': 1}, True, None,
+            id='valid_configuration'),
+        pytest.param(
+            {'start_days': 0, 'end_days': 1}, True, None,
+            id='today_as_start_date_valid'),
+        pytest.param(
+            {'start_days': 0, 'end_days': 90}, True, None,
+            id='exactly_90_days_range'),
+        pytest.param(
+            {'start_days': -1, 'end_days': 1}, False,
+            'Ngày bắt đầu không được ở quá khứ',
+            id='start_date_in_past'),
+        pytest.param(
+            {'start_days': 1, 'end_days': -1}, False, None,
+            id='end_date_in_past'),
+        pytest.param(
+            {'start_days': 10, 'end_days': 5}, False,
+            'Ngày kết thúc phải sau ngày bắt đầu',
+            id='end_date_before_start_date'),
+        pytest.param(
+            {'start_days': 0, 'end_days': 91}, False, '90 ngày',
+            id='date_range_exceeds_90_days'),
+        pytest.param(
+            {'start_days': 0, 'end_days': 1, 'deadline_hours': -1}, False,
+            'Hạn chót trả lời không được ở quá khứ',
+            id='response_deadline_in_past'),
+        pytest.param(
+            {'start_days': 0, 'end_days': 1,
+             'work_hours_start': time(17, 0), 'work_hours_end': time(9, 0)},
+            False, 'Giờ kết thúc phải sau giờ bắt đầu',
+            id='work_end_before_work_start'),
+    ])
+    def test_clean(self, overrides, valid, error):
+        """Test clean across valid and invalid field combinations"""
+        now = timezone.now()
+        form_data = {**BASE_FORM_DATA, **overrides}
+        form_data['date_range_start'] = (
+            now + timedelta(days=form_data.pop('start_days'))).date()
+        form_data['date_range_end'] = (
+            now + timedelta(days=form_data.pop('end_days'))).date()
+        if 'deadline_hours' in form_data:
+            form_data['response_deadline'] = (
+                now + timedelta(hours=form_data.pop('deadline_hours')))
         form = MeetingRequestForm(data=form_data)
-        
-        assert form.is_valid()
 
+        assert form.is_valid() == valid
+        if error is not None:
+            # Plain-list check: str(form.errors) would render the whole
+            # ErrorDict to HTML just to search it for a substring.
+            assert any(error in e for e in form.non_field_errors())
 
-@pytest.mark.django_db
+
+# Aware datetimes for the BusySlot time-range cases, made once at import:
+# make_aware does a current-timezone settings lookup plus a localize per
+# call, and the resulting datetimes are immutable and safely reusable.
+AT_9 = timezone.make_aware(datetime(2024, 1, 1, 9, 0))
+AT_10 = timezone.make_aware(datetime(2024, 1, 1, 10, 0))
+
+
+@pytest.mark.no_db
 class TestBusySlotFormClean:
-    """Test cases for BusySlotForm.clean method"""
-    
+    """Test cases for BusySlotForm.clean method
+
+    BusySlotForm only compares the two times; no DB access involved.
+    """
+
     def test_end_after_start_valid(self):
         """Test clean with end after start (valid)"""
         form_data = {
-            'start_time': timezone.make_aware(
-                timezone.datetime(2024, 1, 1, 9, 0)
-            ),
-            'end_time': timezone.make_aware(
-                timezone.datetime(2024, 1, 1, 10, 0)
-            ),
+            'start_time': AT_9,
+            'end_time': AT_10,
             'description': 'Busy'
         }
         form = BusySlotForm(data=form_data)
-        
+
         assert form.is_valid()
-    
+
     def test_end_before_start_invalid(self):
         """Test clean with end before start (invalid)"""
         form_data = {
-            'start_time': timezone.make_aware(
-                timezone.datetime(2024, 1, 1, 10, 0)
-            ),
-            'end_time': timezone.make_aware(
-                timezone.datetime(2024, 1, 1, 9, 0)
-            ),
+            'start_time': AT_10,
+            'end_time': AT_9,
             'description': 'Busy'
         }
         form = BusySlotForm(data=form_data)
-        
+
         assert not form.is_valid()
-        assert 'Thời gian kết thúc phải sau thời gian bắt đầu' in str(form.errors)
-    
+        assert 'Thời gian kết thúc phải sau thời gian bắt đầu' in form.non_field_errors()
+
     def test_end_equals_start_invalid(self):
         """Test clean with end equals start (invalid)"""
-        same_time = timezone.make_aware(
-            timezone.datetime(2024, 1, 1, 9, 0)
-        )
         form_data = {
-            'start_time': same_time,
-            'end_time': same_time,
+            'start_time': AT_9,
+            'end_time': AT_9,
             'description': 'Busy'
         }
         form = BusySlotForm(data=form_data)
-        
+
         assert not form.is_valid()
@@ -14,6 +14,7 @@ class TestGenerateTimeSlots:
     def test_single_day_generation(self, create_meeting_request):
         """Test generating slots for a single day"""
         meeting_request = create_meeting_request(
+            save=False,
             duration_minutes=60,
             step_size_minutes=30,
             date_range_start=date(2024, 1, 1),
@@ -40,6 +41,7 @@ class TestGenerateTimeSlots:
     def test_multiple_days_generation(self, create_meeting_request):
         """Test generating slots across multiple days"""
         meeting_request = create_meeting_request(
+            save=False,
             duration_minutes=60,
             step_size_minutes=60,
             date_range_start=date(2024, 1, 1),
@@ -59,6 +61,7 @@ class TestGenerateTimeSlots:
         """Test skipping weekends when work_days_only is True"""
         # Jan 1, 2024 is Monday
         meeting_request = create_meeting_request(
+            save=False,
             duration_minutes=60,
             step_size_minutes=60,
             date_range_start=date(2024, 1, 1),  # Monday
@@ -77,6 +80,7 @@ class TestGenerateTimeSlots:
     def test_timezone_conversion(self, create_meeting_request):
         """Test that slots are correctly converted to UTC from other timezones"""
         meeting_request = create_meeting_request(
+            save=False,
             duration_minutes=60,
             step_size_minutes=60,
             date_range_start=date(2024, 1, 1),
@@ -100,6 +104,7 @@ class TestGenerateTimeSlots:
     def test_no_slots_when_duration_too_long(self, create_meeting_request):
         """Test that no slots are generated when duration is longer than work hours"""
         meeting_request = create_meeting_request(
+            save=False,
             duration_minutes=120,  # 2 hours
             step_size_minutes=30,
             date_range_start=date(2024, 1, 1),
@@ -116,6 +121,7 @@ class TestGenerateTimeSlots:
     def test_slot_duration_matches_request(self, create_meeting_request):
         """Test that generated slots have correct duration"""
         meeting_request = create_meeting_request(
+            save=False,
             duration_minutes=45,
             step_size_minutes=30,
             date_range_start=date(2024, 1, 1),
@@ -135,6 +141,7 @@ class TestGenerateTimeSlots:
     def test_slots_respect_step_size(self, create_meeting_request):
         """Test that slots are generated with correct step size"""
         meeting_request = create_meeting_request(
+            save=False,
             duration_minutes=30,
             step_size_minutes=15,
             date_range_start=date(2024, 1, 1),
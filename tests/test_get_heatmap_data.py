@@ -3,59 +3,109 @@ Unit tests for get_heatmap_data function
 Tests heatmap generation for visualization
 """
 import pytest
-import pytz
-from datetime import datetime, date, time
+from datetime import datetime, date, time, timezone as dt_timezone
 from meetings.utils import get_heatmap_data
 from meetings.models import SuggestedSlot
 
+# Jan 1 2024 hour marks in UTC, built once at import: every suggested-slot
+# case reuses these immutable instances instead of constructing fresh
+# datetimes per test. create_utc_datetime stays for arbitrary dates.
+JAN1_09 = datetime(2024, 1, 1, 9, 0, tzinfo=dt_timezone.utc)
+JAN1_10 = datetime(2024, 1, 1, 10, 0, tzinfo=dt_timezone.utc)
+JAN1_11 = datetime(2024, 1, 1, 11, 0, tzinfo=dt_timezone.utc)
+JAN1_14 = datetime(2024, 1, 1, 14, 0, tzinfo=dt_timezone.utc)
+JAN1_15 = datetime(2024, 1, 1, 15, 0, tzinfo=dt_timezone.utc)
+
 
 @pytest.mark.django_db
 class TestGetHeatmapData:
     """Test cases for get_heatmap_data function"""
-    
-    def test_with_suggested_slots(self, create_meeting_request, create_utc_datetime):
+
+    # Scenarios that seed SuggestedSlot rows: (meeting kwargs, slot specs,
+    # participant timezone, expectations). Slots are inserted with one
+    # bulk_create per test instead of a .create() round-trip per row.
+    HEATMAP_CASES = [
+        pytest.param(
+            dict(date_range_start=date(2024, 1, 1), date_range_end=date(2024, 1, 2),
+                 work_hours_start=time(9, 0), work_hours_end=time(12, 0)),
+            [dict(start_time=JAN1_09, end_time=JAN1_10,
+                  available_count=8, total_participants=10),
+             dict(start_time=JAN1_10, end_time=JAN1_11,
+                  available_count=5, total_participants=10)],
+            'Asia/Ho_Chi_Minh',
+            # 09:00 UTC = 16:00 +7
+            dict(time_slot='16:00'),
+            id='with_suggested_slots'),
+        pytest.param(
+            dict(date_range_start=date(2024, 1, 1), date_range_end=date(2024, 1, 1),
+                 work_hours_start=time(9, 0), work_hours_end=time(11, 0)),
+            [dict(start_time=JAN1_09, end_time=JAN1_10,
+                  available_count=5, total_participants=10)],
+            'Asia/Ho_Chi_Minh',
+            # 09:00 UTC should be 16:00 in Asia/Ho_Chi_Minh
+            dict(time_slot='16:00'),
+            id='cross_timezone_conversion_utc_to_asia_ho_chi_minh'),
+        pytest.param(
+            dict(date_range_start=date(2024, 1, 1), date_range_end=date(2024, 1, 1),
+                 work_hours_start=time(14, 0), work_hours_end=time(16, 0)),
+            [dict(start_time=JAN1_14, end_time=JAN1_15,
+                  available_count=5, total_participants=10)],
+            'America/New_York',
+            # 14:00 UTC should be 09:00 EST (UTC-5 in winter)
+            dict(time_slot='09:00'),
+            id='different_participant_timezone_america_new_york'),
+        pytest.param(
+            dict(date_range_start=date(2024, 1, 1), date_range_end=date(2024, 1, 1),
+                 work_hours_start=time(9, 0), work_hours_end=time(11, 0)),
+            [dict(start_time=JAN1_09, end_time=JAN1_10,
+                  available_count=0, total_participants=10)],
+            'UTC',
+            dict(cell=('2024-01-01', '09:00',
+                       dict(level=0, available=0, percentage=0.0))),
+            id='slots_with_zero_percent_availability'),
+        pytest.param(
+            dict(date_range_start=date(2024, 1, 1), date_range_end=date(2024, 1, 1),
+                 work_hours_start=time(9, 0), work_hours_end=time(11, 0)),
+            [dict(start_time=JAN1_09, end_time=JAN1_10,
+                  available_count=10, total_participants=10)],
+            'UTC',
+            dict(cell=('2024-01-01', '09:00',
+                       dict(level=5, available=10, percentage=100.0))),
+            id='slots_with_hundred_percent_availability'),
+    ]
+
+    @pytest.mark.parametrize('meeting_kwargs,slots,participant_tz,expect', HEATMAP_CASES)
+    def test_with_suggested_slots(self, create_meeting_request, meeting_kwargs,
+                                  slots, participant_tz, expect):
         """Test heatmap generation with existing suggested slots"""
         meeting = create_meeting_request(
-            date_range_start=date(2024, 1, 1),
-            date_range_end=date(2024, 1, 2),
-            work_hours_start=time(9, 0),
-            work_hours_end=time(12, 0),
             step_size_minutes=60,
             duration_minutes=60,
-            timezone='UTC'
+            timezone='UTC',
+            **meeting_kwargs
         )
-        
-        # Create suggested slots
-        SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 9, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            available_count=8,
-            total_participants=10
-        )
-        SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 11, 0),
-            available_count=5,
-            total_participants=10
-        )
-        
-        # Generate heatmap
-        heatmap_data = get_heatmap_data(meeting, participant_timezone='Asia/Ho_Chi_Minh')
-        
+        SuggestedSlot.objects.bulk_create([
+            SuggestedSlot(meeting_request=meeting, **spec) for spec in slots
+        ])
+
+        heatmap_data = get_heatmap_data(meeting, participant_timezone=participant_tz)
+
         assert 'dates' in heatmap_data
         assert 'time_slots' in heatmap_data
         assert 'heatmap' in heatmap_data
-        assert 'timezone' in heatmap_data
-        assert heatmap_data['timezone'] == 'Asia/Ho_Chi_Minh'
+        assert heatmap_data['timezone'] == participant_tz
         assert len(heatmap_data['dates']) > 0
-        
-        # Check that times are converted to Asia/Ho_Chi_Minh (+7 hours)
-        first_date = heatmap_data['dates'][0]
-        assert first_date in heatmap_data['heatmap']
-        assert '16:00' in heatmap_data['heatmap'][first_date]  # 09:00 UTC = 16:00 +7
-    
+
+        if 'time_slot' in expect:
+            assert expect['time_slot'] in heatmap_data['time_slots']
+            first_date = heatmap_data['dates'][0]
+            assert expect['time_slot'] in heatmap_data['heatmap'][first_date]
+        if 'cell' in expect:
+            date_str, time_str, fields = expect['cell']
+            slot_data = heatmap_data['heatmap'][date_str][time_str]
+            for key, value in fields.items():
+                assert slot_data[key] == value
+
     def test_no_suggested_slots_generate_from_scratch(self, create_meeting_request):
         """Test heatmap generation when no suggested slots exist"""
         meeting = create_meeting_request(
@@ -98,7 +148,7 @@ class TestGetHeatmapData:
         assert 'dates' in heatmap_data
         assert len(heatmap_data['dates']) == 0
     
-    def test_single_date(self, create_meeting_request, create_utc_datetime):
+    def test_single_date(self, create_meeting_request):
         """Test heatmap with single date"""
         meeting = create_meeting_request(
             date_range_start=date(2024, 1, 15),
@@ -114,117 +164,3 @@ class TestGetHeatmapData:
         
         assert len(heatmap_data['dates']) == 1
         assert heatmap_data['dates'][0] == '2024-01-15'
-    
-    def test_cross_timezone_conversion_utc_to_asia_ho_chi_minh(
-        self, create_meeting_request, create_utc_datetime
-    ):
-        """Test timezone conversion from UTC to Asia/Ho_Chi_Minh (+7 hours)"""
-        meeting = create_meeting_request(
-            date_range_start=date(2024, 1, 1),
-            date_range_end=date(2024, 1, 1),
-            work_hours_start=time(9, 0),
-            work_hours_end=time(11, 0),
-            step_size_minutes=60,
-            duration_minutes=60,
-            timezone='UTC'
-        )
-        
-        # Create a slot at 09:00 UTC
-        SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 9, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            available_count=5,
-            total_participants=10
-        )
-        
-        heatmap_data = get_heatmap_data(meeting, participant_timezone='Asia/Ho_Chi_Minh')
-        
-        # 09:00 UTC should be 16:00 in Asia/Ho_Chi_Minh
-        assert '16:00' in heatmap_data['time_slots']
-    
-    def test_different_participant_timezone_america_new_york(
-        self, create_meeting_request, create_utc_datetime
-    ):
-        """Test timezone conversion to America/New_York"""
-        meeting = create_meeting_request(
-            date_range_start=date(2024, 1, 1),
-            date_range_end=date(2024, 1, 1),
-            work_hours_start=time(14, 0),
-            work_hours_end=time(16, 0),
-            step_size_minutes=60,
-            duration_minutes=60,
-            timezone='UTC'
-        )
-        
-        # Create a slot at 14:00 UTC
-        SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 14, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 15, 0),
-            available_count=5,
-            total_participants=10
-        )
-        
-        heatmap_data = get_heatmap_data(meeting, participant_timezone='America/New_York')
-        
-        # 14:00 UTC should be 09:00 EST (UTC-5 in winter)
-        assert '09:00' in heatmap_data['time_slots']
-    
-    def test_slots_with_zero_percent_availability(
-        self, create_meeting_request, create_utc_datetime
-    ):
-        """Test heatmap with 0% availability slots"""
-        meeting = create_meeting_request(
-            date_range_start=date(2024, 1, 1),
-            date_range_end=date(2024, 1, 1),
-            work_hours_start=time(9, 0),
-            work_hours_end=time(11, 0),
-            step_size_minutes=60,
-            duration_minutes=60,
-            timezone='UTC'
-        )
-        
-        SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 9, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            available_count=0,
-            total_participants=10
-        )
-        
-        heatmap_data = get_heatmap_data(meeting, participant_timezone='UTC')
-        
-        slot_data = heatmap_data['heatmap']['2024-01-01']['09:00']
-        assert slot_data['level'] == 0
-        assert slot_data['available'] == 0
-        assert slot_data['percentage'] == 0.0
-    
-    def test_slots_with_hundred_percent_availability(
-        self, create_meeting_request, create_utc_datetime
-    ):
-        """Test heatmap with 100% availability slots"""
-        meeting = create_meeting_request(
-            date_range_start=date(2024, 1, 1),
-            date_range_end=date(2024, 1, 1),
-            work_hours_start=time(9, 0),
-            work_hours_end=time(11, 0),
-            step_size_minutes=60,
-            duration_minutes=60,
-            timezone='UTC'
-        )
-        
-        SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 9, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            available_count=10,
-            total_participants=10
-        )
-        
-        heatmap_data = get_heatmap_data(meeting, participant_timezone='UTC')
-        
-        slot_data = heatmap_data['heatmap']['2024-01-01']['09:00']
-        assert slot_data['level'] == 5
-        assert slot_data['available'] == 10
-        assert slot_data['percentage'] == 100.0
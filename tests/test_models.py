@@ -2,20 +2,51 @@
 Unit tests for models.py
 Tests for MeetingRequest, Participant, BusySlot, and SuggestedSlot models
 """
+import freezegun
+import itertools
 import pytest
-from datetime import datetime, date, time, timedelta
+from datetime import datetime, date, time, timedelta, timezone as dt_timezone
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from django.contrib.auth.models import User
-import pytz
 
 from meetings.models import MeetingRequest, Participant, BusySlot, SuggestedSlot
 
+# One freeze point for the whole module: the is_active tests read
+# timezone.now() several times per test, and freezing makes each read a
+# constant while keeping the past/future deadline math deterministic.
+FROZEN_TIME = '2024-06-15 12:00:00+00:00'
+
+# Jan 1 2024 hour marks in UTC, built once at import: the slot tests all
+# reuse these immutable instances instead of constructing per test.
+JAN1_09 = datetime(2024, 1, 1, 9, 0, tzinfo=dt_timezone.utc)
+JAN1_10 = datetime(2024, 1, 1, 10, 0, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture(autouse=True, scope='module')
+def _frozen_time():
+    """Freeze timezone.now() at FROZEN_TIME for every test in this module"""
+    with freezegun.freeze_time(FROZEN_TIME) as ft:
+        yield ft
+
 
 # =============================================================================
 # MeetingRequest Model Tests
 # =============================================================================
 
+@pytest.fixture
+def _fast_token(monkeypatch):
+    """Deterministic share tokens: skip the urandom read in save()
+
+    These tests only assert that a token appears and stays stable, never
+    that it is random, so a counter is a faithful stand-in.
+    """
+    counter = itertools.count()
+    monkeypatch.setattr('secrets.token_urlsafe',
+                        lambda nbytes=32: f'tok{next(counter):08d}')
+
+
+@pytest.mark.usefixtures('_fast_token')
 class TestMeetingRequestSave:
     """Tests for MeetingRequest.save() method"""
     
@@ -55,94 +86,93 @@ class TestMeetingRequestIsActive:
     
     def test_active_with_no_deadline(self, db, create_meeting_request):
         """Test that active meeting with no deadline is active"""
-        meeting = create_meeting_request(status='active', response_deadline=None)
+        meeting = create_meeting_request(save=False, status='active', response_deadline=None)
         assert meeting.is_active is True
     
     def test_active_with_future_deadline(self, db, create_meeting_request):
         """Test that active meeting with future deadline is active"""
         future = timezone.now() + timedelta(days=1)
-        meeting = create_meeting_request(status='active', response_deadline=future)
+        meeting = create_meeting_request(save=False, status='active', response_deadline=future)
         assert meeting.is_active is True
     
     def test_active_with_past_deadline(self, db, create_meeting_request):
         """Test that active meeting with past deadline is not active"""
         past = timezone.now() - timedelta(days=1)
-        meeting = create_meeting_request(status='active', response_deadline=past)
+        meeting = create_meeting_request(save=False, status='active', response_deadline=past)
         assert meeting.is_active is False
     
     def test_status_locked(self, db, create_meeting_request):
         """Test that locked meeting is not active"""
         future = timezone.now() + timedelta(days=1)
-        meeting = create_meeting_request(status='locked', response_deadline=future)
+        meeting = create_meeting_request(save=False, status='locked', response_deadline=future)
         assert meeting.is_active is False
     
     def test_status_cancelled(self, db, create_meeting_request):
         """Test that cancelled meeting is not active"""
         future = timezone.now() + timedelta(days=1)
-        meeting = create_meeting_request(status='cancelled', response_deadline=future)
+        meeting = create_meeting_request(save=False, status='cancelled', response_deadline=future)
         assert meeting.is_active is False
     
     def test_status_draft(self, db, create_meeting_request):
         """Test that draft meeting is not active"""
         future = timezone.now() + timedelta(days=1)
-        meeting = create_meeting_request(status='draft', response_deadline=future)
+        meeting = create_meeting_request(save=False, status='draft', response_deadline=future)
         assert meeting.is_active is False
 
 
 class TestMeetingRequestResponseRate:
-    """Tests for MeetingRequest.response_rate property"""
-    
-    def test_no_participants(self, db, create_meeting_request):
+    """Tests for MeetingRequest.response_rate property
+
+    These tests only hang per-test participant rows off a default
+    meeting, so they share the session-committed shared_meeting instead
+    of inserting a MeetingRequest each; the participants themselves roll
+    back with each test's transaction.
+    """
+
+    def test_no_participants(self, db, shared_meeting):
         """Test response rate with no participants"""
-        meeting = create_meeting_request()
-        assert meeting.response_rate == 0
+        assert shared_meeting.response_rate == 0
     
-    def test_all_responded(self, db, create_meeting_request, create_participant):
+    def test_all_responded(self, db, shared_meeting, create_participants_bulk):
         """Test response rate when all participants responded"""
-        meeting = create_meeting_request()
-        for i in range(5):
-            create_participant(meeting, email=f"user{i}@test.com", has_responded=True)
-        assert meeting.response_rate == 100
-    
-    def test_none_responded(self, db, create_meeting_request, create_participant):
+        create_participants_bulk(shared_meeting, 5, has_responded=True)
+        assert shared_meeting.response_rate == 100
+
+    def test_none_responded(self, db, shared_meeting, create_participants_bulk):
         """Test response rate when no participants responded"""
-        meeting = create_meeting_request()
-        for i in range(5):
-            create_participant(meeting, email=f"user{i}@test.com", has_responded=False)
-        assert meeting.response_rate == 0
-    
-    def test_some_responded(self, db, create_meeting_request, create_participant):
+        create_participants_bulk(shared_meeting, 5, has_responded=False)
+        assert shared_meeting.response_rate == 0
+
+    def test_some_responded(self, db, shared_meeting, create_participants_bulk):
         """Test response rate when some participants responded"""
-        meeting = create_meeting_request()
-        for i in range(5):
-            responded = i < 3
-            create_participant(meeting, email=f"user{i}@test.com", has_responded=responded)
-        assert meeting.response_rate == 60
-    
-    def test_rounding(self, db, create_meeting_request, create_participant):
+        create_participants_bulk(shared_meeting, 3, has_responded=True, email_prefix='responded')
+        create_participants_bulk(shared_meeting, 2, has_responded=False, email_prefix='pending')
+        assert shared_meeting.response_rate == 60
+
+    def test_rounding(self, db, shared_meeting, create_participants_bulk):
         """Test response rate rounding (1/3 = 33.33% -> 33)"""
-        meeting = create_meeting_request()
-        for i in range(3):
-            responded = i < 1
-            create_participant(meeting, email=f"user{i}@test.com", has_responded=responded)
-        assert meeting.response_rate == 33
+        create_participants_bulk(shared_meeting, 1, has_responded=True, email_prefix='responded')
+        create_participants_bulk(shared_meeting, 2, has_responded=False, email_prefix='pending')
+        assert shared_meeting.response_rate == 33
 
 
 class TestMeetingRequestGetShareUrl:
-    """Tests for MeetingRequest.get_share_url() method"""
+    """Tests for MeetingRequest.get_share_url() method
+
+    Read-only against the session-committed meeting: get_share_url only
+    formats the id and token.
+    """
     
-    def test_valid_uuid_and_token(self, db, create_meeting_request):
+    def test_valid_uuid_and_token(self, db, shared_meeting):
         """Test share URL generation with valid UUID and token"""
-        meeting = create_meeting_request()
-        url = meeting.get_share_url()
-        assert url == f"/r/{meeting.id}?t={meeting.token}"
+        url = shared_meeting.get_share_url()
+        assert url == f"/r/{shared_meeting.id}?t={shared_meeting.token}"
     
-    def test_special_characters_in_token(self, db, create_meeting_request):
+    def test_special_characters_in_token(self, db, shared_meeting):
         """Test share URL with special characters in token"""
-        meeting = create_meeting_request()
         # Token generated by secrets.token_urlsafe should be URL-safe
-        url = meeting.get_share_url()
-        assert f"/r/{meeting.id}?t=" in url
+        url = shared_meeting.get_share_url()
+        assert f"/r/{shared_meeting.id}?t=" in url
 
 
 # =============================================================================
@@ -191,49 +221,42 @@ class TestParticipantStr:
 # BusySlot Model Tests
 # =============================================================================
 
+@pytest.mark.no_db
 class TestBusySlotClean:
-    """Tests for BusySlot.clean() validation method"""
-    
-    def test_valid_time_range(self, db, create_meeting_request, create_participant, create_utc_datetime):
+    """Tests for BusySlot.clean() validation method
+
+    clean() only compares start_time to end_time, so the slots are built
+    around an unsaved in-memory participant — no INSERTs, no db fixture.
+    """
+
+    participant = Participant(name='In-memory Participant')
+
+    def test_valid_time_range(self):
         """Test that valid time range passes validation"""
-        meeting = create_meeting_request()
-        participant = create_participant(meeting)
-        start = create_utc_datetime(2024, 1, 1, 9, 0)
-        end = create_utc_datetime(2024, 1, 1, 10, 0)
-        
         busy_slot = BusySlot(
-            participant=participant,
-            start_time=start,
-            end_time=end
+            participant=self.participant,
+            start_time=JAN1_09,
+            end_time=JAN1_10
         )
         # Should not raise ValidationError
         busy_slot.clean()
-    
-    def test_start_equals_end(self, db, create_meeting_request, create_participant, create_utc_datetime):
+
+    def test_start_equals_end(self):
         """Test that start time equal to end time raises ValidationError"""
-        meeting = create_meeting_request()
-        participant = create_participant(meeting)
-        start = create_utc_datetime(2024, 1, 1, 9, 0)
-        
         busy_slot = BusySlot(
-            participant=participant,
-            start_time=start,
-            end_time=start
+            participant=self.participant,
+            start_time=JAN1_09,
+            end_time=JAN1_09
         )
         with pytest.raises(ValidationError):
             busy_slot.clean()
-    
-    def test_start_after_end(self, db, create_meeting_request, create_participant, create_utc_datetime):
+
+    def test_start_after_end(self):
         """Test that start time after end time raises ValidationError"""
-        meeting = create_meeting_request()
-        participant = create_participant(meeting)
-        start = create_utc_datetime(2024, 1, 1, 10, 0)
-        end = create_utc_datetime(2024, 1, 1, 9, 0)
-        
         busy_slot = BusySlot(
-            participant=participant,
-            start_time=start,
-            end_time=end
+            participant=self.participant,
+            start_time=JAN1_10,
+            end_time=JAN1_09
         )
         with pytest.raises(ValidationError):
             busy_slot.clean()
@@ -243,107 +266,70 @@ class TestBusySlotClean:
 # SuggestedSlot Model Tests
 # =============================================================================
 
+@pytest.mark.no_db
 class TestSuggestedSlotAvailabilityPercentage:
-    """Tests for SuggestedSlot.availability_percentage property"""
-    
-    def test_no_participants(self, db, create_meeting_request, create_suggested_slot, create_utc_datetime):
-        """Test availability percentage with no participants"""
-        meeting = create_meeting_request()
-        start = create_utc_datetime(2024, 1, 1, 9, 0)
-        end = create_utc_datetime(2024, 1, 1, 10, 0)
-        slot = create_suggested_slot(
-            meeting,
-            start,
-            end,
-            available_count=0,
-            total_participants=0
-        )
-        assert slot.availability_percentage == 0.0
-    
-    def test_none_available(self, db, create_meeting_request, create_suggested_slot, create_utc_datetime):
-        """Test availability percentage when none available"""
-        meeting = create_meeting_request()
-        start = create_utc_datetime(2024, 1, 1, 9, 0)
-        end = create_utc_datetime(2024, 1, 1, 10, 0)
-        slot = create_suggested_slot(
-            meeting,
-            start,
-            end,
-            available_count=0,
-            total_participants=5
-        )
-        assert slot.availability_percentage == 0.0
-    
-    def test_all_available(self, db, create_meeting_request, create_suggested_slot, create_utc_datetime):
-        """Test availability percentage when all available"""
-        meeting = create_meeting_request()
-        start = create_utc_datetime(2024, 1, 1, 9, 0)
-        end = create_utc_datetime(2024, 1, 1, 10, 0)
-        slot = create_suggested_slot(
-            meeting,
-            start,
-            end,
-            available_count=5,
-            total_participants=5
-        )
-        assert slot.availability_percentage == 100.0
-    
-    def test_rounding_case_66_percent(self, db, create_meeting_request, create_suggested_slot, create_utc_datetime):
-        """Test availability percentage rounding (2/3 = 66.666% -> 66.7)"""
-        meeting = create_meeting_request()
-        start = create_utc_datetime(2024, 1, 1, 9, 0)
-        end = create_utc_datetime(2024, 1, 1, 10, 0)
-        slot = create_suggested_slot(
-            meeting,
-            start,
-            end,
-            available_count=2,
-            total_participants=3
-        )
-        assert slot.availability_percentage == 66.7
-    
-    def test_rounding_case_33_percent(self, db, create_meeting_request, create_suggested_slot, create_utc_datetime):
-        """Test availability percentage rounding (1/3 = 33.333% -> 33.3)"""
-        meeting = create_meeting_request()
-        start = create_utc_datetime(2024, 1, 1, 9, 0)
-        end = create_utc_datetime(2024, 1, 1, 10, 0)
-        slot = create_suggested_slot(
-            meeting,
-            start,
-            end,
-            available_count=1,
-            total_participants=3
+    """Tests for SuggestedSlot.availability_percentage property
+
+    The property is pure arithmetic over instance attributes, so the
+    slots are plain unsaved instances — no MeetingRequest row, no db.
+    One table covers this class and the near-duplicate that used to
+    live in test_models_extended.py; each case asserts the percentage
+    and the heatmap level derived from it together.
+    """
+
+    @pytest.mark.parametrize("available,total,expected_pct,expected_level", [
+        (0, 0, 0.0, 0),     # no participants (division-by-zero guard)
+        (0, 5, 0.0, 0),     # none available
+        (5, 5, 100.0, 5),   # all available
+        (7, 10, 70.0, 4),   # partial availability
+        (2, 3, 66.7, 4),    # 66.666% rounds to 66.7
+        (1, 3, 33.3, 2),    # 33.333% rounds to 33.3
+    ])
+    def test_slot_properties(self, available, total, expected_pct, expected_level):
+        """Test availability percentage and derived heatmap level"""
+        slot = SuggestedSlot(
+            start_time=JAN1_09,
+            end_time=JAN1_10,
+            available_count=available,
+            total_participants=total
         )
-        assert slot.availability_percentage == 33.3
+        assert slot.availability_percentage == expected_pct
+        assert slot.heatmap_level == expected_level
 
 
+@pytest.mark.no_db
 class TestSuggestedSlotHeatmapLevel:
-    """Tests for SuggestedSlot.heatmap_level property"""
-    
+    """Tests for SuggestedSlot.heatmap_level property
+
+    Same as above: heatmap_level never touches the DB, so each case uses
+    an unsaved instance instead of a MeetingRequest + INSERT per row.
+    """
+
     @pytest.mark.parametrize("available,total,expected_level,scenario", [
         (0, 10, 0, "0%"),
         (1, 1000, 1, "0.1%"),
+        (1, 10, 1, "10%"),
         (199, 1000, 1, "19.9%"),
         (2, 10, 2, "20% boundary"),
+        (3, 10, 2, "30%"),
         (399, 1000, 2, "39.9%"),
         (4, 10, 3, "40% boundary"),
+        (5, 10, 3, "50%"),
         (599, 1000, 3, "59.9%"),
         (6, 10, 4, "60% boundary"),
+        (7, 10, 4, "70%"),
         (799, 1000, 4, "79.9%"),
         (8, 10, 5, "80% boundary"),
+        (9, 10, 5, "90%"),
         (10, 10, 5, "100%"),
     ])
-    def test_heatmap_levels(self, db, create_meeting_request, create_suggested_slot, 
-                           create_utc_datetime, available, total, expected_level, scenario):
+    def test_heatmap_levels(self, available, total, expected_level, scenario):
         """Test heatmap level for various availability percentages"""
-        meeting = create_meeting_request()
-        start = create_utc_datetime(2024, 1, 1, 9, 0)
-        end = create_utc_datetime(2024, 1, 1, 10, 0)
-        
-        slot = create_suggested_slot(
-            meeting, start, end,
-            available_count=available, 
+        slot = SuggestedSlot(
+            start_time=JAN1_09,
+            end_time=JAN1_10,
+            available_count=available,
             total_participants=total
         )
-        
+
         assert slot.heatmap_level == expected_level, f"Failed: {scenario}"
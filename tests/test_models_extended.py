@@ -3,11 +3,10 @@ Extended unit tests for models.py
 Tests model methods, properties, and validation
 """
 import pytest
-from datetime import datetime, date, time, timedelta
+from datetime import date, time, timedelta
 from django.utils import timezone
 from django.core.exceptions import ValidationError
-from meetings.models import MeetingRequest, Participant, BusySlot, SuggestedSlot
-import pytz
+from meetings.models import MeetingRequest, BusySlot
 
 
 @pytest.mark.django_db
@@ -79,6 +78,7 @@ class TestMeetingRequestIsActive:
     def test_active_with_no_deadline(self, create_meeting_request):
         """Test is_active when status is active and no deadline"""
         meeting = create_meeting_request(
+            save=False,
             status='active',
             response_deadline=None
         )
@@ -89,6 +89,7 @@ class TestMeetingRequestIsActive:
         """Test is_active with future deadline"""
         future = timezone.now() + timedelta(days=1)
         meeting = create_meeting_request(
+            save=False,
             status='active',
             response_deadline=future
         )
@@ -99,6 +100,7 @@ class TestMeetingRequestIsActive:
         """Test is_active with past deadline"""
         past = timezone.now() - timedelta(days=1)
         meeting = create_meeting_request(
+            save=False,
             status='active',
             response_deadline=past
         )
@@ -109,6 +111,7 @@ class TestMeetingRequestIsActive:
         """Test is_active when status is locked"""
         future = timezone.now() + timedelta(days=1)
         meeting = create_meeting_request(
+            save=False,
             status='locked',
             response_deadline=future
         )
@@ -119,6 +122,7 @@ class TestMeetingRequestIsActive:
         """Test is_active when status is cancelled"""
         future = timezone.now() + timedelta(days=1)
         meeting = create_meeting_request(
+            save=False,
             status='cancelled',
             response_deadline=future
         )
@@ -136,32 +140,25 @@ class TestMeetingRequestResponseRate:
         
         assert meeting.response_rate == 0
     
-    def test_no_responses(self, create_meeting_request, create_participant):
+    def test_no_responses(self, create_meeting_request, create_participants_bulk):
         """Test response_rate with no responses"""
         meeting = create_meeting_request()
-        
-        for i in range(5):
-            create_participant(meeting, has_responded=False)
+        create_participants_bulk(meeting, 5, has_responded=False)
         
         assert meeting.response_rate == 0
     
-    def test_all_responded(self, create_meeting_request, create_participant):
+    def test_all_responded(self, create_meeting_request, create_participants_bulk):
         """Test response_rate when all responded"""
         meeting = create_meeting_request()
-        
-        for i in range(5):
-            create_participant(meeting, has_responded=True)
+        create_participants_bulk(meeting, 5, has_responded=True)
         
         assert meeting.response_rate == 100
     
-    def test_partial_responses(self, create_meeting_request, create_participant):
+    def test_partial_responses(self, create_meeting_request, create_participants_bulk):
         """Test response_rate with partial responses"""
         meeting = create_meeting_request()
-        
-        for i in range(7):
-            create_participant(meeting, has_responded=True)
-        for i in range(3):
-            create_participant(meeting, has_responded=False)
+        create_participants_bulk(meeting, 7, has_responded=True, email_prefix='responded')
+        create_participants_bulk(meeting, 3, has_responded=False, email_prefix='pending')
         
         assert meeting.response_rate == 70
     
@@ -257,160 +254,3 @@ class TestBusySlotClean:
         
         with pytest.raises(ValidationError):
             busy_slot.clean()
-
-
-@pytest.mark.django_db
-class TestSuggestedSlotAvailabilityPercentage:
-    """Test cases for SuggestedSlot.availability_percentage property"""
-    
-    def test_zero_total_participants(self, create_meeting_request, create_utc_datetime):
-        """Test availability_percentage with 0 total participants (division by zero)"""
-        meeting = create_meeting_request()
-        slot = SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 9, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            available_count=0,
-            total_participants=0
-        )
-        
-        assert slot.availability_percentage == 0.0
-    
-    def test_all_available_100_percent(self, create_meeting_request, create_utc_datetime):
-        """Test availability_percentage with 100% availability"""
-        meeting = create_meeting_request()
-        slot = SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 9, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            available_count=10,
-            total_participants=10
-        )
-        
-        assert slot.availability_percentage == 100.0
-    
-    def test_none_available_0_percent(self, create_meeting_request, create_utc_datetime):
-        """Test availability_percentage with 0% availability"""
-        meeting = create_meeting_request()
-        slot = SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 9, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            available_count=0,
-            total_participants=10
-        )
-        
-        assert slot.availability_percentage == 0.0
-    
-    def test_partial_availability(self, create_meeting_request, create_utc_datetime):
-        """Test availability_percentage with partial availability"""
-        meeting = create_meeting_request()
-        slot = SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 9, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            available_count=7,
-            total_participants=10
-        )
-        
-        assert slot.availability_percentage == 70.0
-    
-    def test_rounding(self, create_meeting_request, create_utc_datetime):
-        """Test availability_percentage rounding"""
-        meeting = create_meeting_request()
-        slot = SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 9, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            available_count=2,
-            total_participants=3
-        )
-        
-        # 2/3 = 66.666... should round to 66.7
-        assert slot.availability_percentage == 66.7
-
-
-@pytest.mark.django_db
-class TestSuggestedSlotHeatmapLevel:
-    """Test cases for SuggestedSlot.heatmap_level property"""
-    
-    @pytest.mark.parametrize('available,total,expected_level', [
-        (0, 10, 0),   # 0%
-        (1, 10, 1),   # 10%
-        (2, 10, 2),   # 20%
-        (3, 10, 2),   # 30%
-        (4, 10, 3),   # 40%
-        (5, 10, 3),   # 50%
-        (6, 10, 4),   # 60%
-        (7, 10, 4),   # 70%
-        (8, 10, 5),   # 80%
-        (9, 10, 5),   # 90%
-        (10, 10, 5),  # 100%
-    ])
-    def test_heatmap_level_boundaries(
-        self, create_meeting_request, create_utc_datetime, 
-        available, total, expected_level
-    ):
-        """Test heatmap_level at various availability percentages"""
-        meeting = create_meeting_request()
-        slot = SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 9, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            available_count=available,
-            total_participants=total
-        )
-        
-        assert slot.heatmap_level == expected_level
-    
-    def test_boundary_20_percent(self, create_meeting_request, create_utc_datetime):
-        """Test heatmap_level at exactly 20%"""
-        meeting = create_meeting_request()
-        slot = SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 9, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            available_count=2,
-            total_participants=10
-        )
-        
-        assert slot.heatmap_level == 2
-    
-    def test_boundary_40_percent(self, create_meeting_request, create_utc_datetime):
-        """Test heatmap_level at exactly 40%"""
-        meeting = create_meeting_request()
-        slot = SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 9, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            available_count=4,
-            total_participants=10
-        )
-        
-        assert slot.heatmap_level == 3
-    
-    def test_boundary_60_percent(self, create_meeting_request, create_utc_datetime):
-        """Test heatmap_level at exactly 60%"""
-        meeting = create_meeting_request()
-        slot = SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 9, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            available_count=6,
-            total_participants=10
-        )
-        
-        assert slot.heatmap_level == 4
-    
-    def test_boundary_80_percent(self, create_meeting_request, create_utc_datetime):
-        """Test heatmap_level at exactly 80%"""
-        meeting = create_meeting_request()
-        slot = SuggestedSlot.objects.create(
-            meeting_request=meeting,
-            start_time=create_utc_datetime(2024, 1, 1, 9, 0),
-            end_time=create_utc_datetime(2024, 1, 1, 10, 0),
-            available_count=8,
-            total_participants=10
-        )
-        
-        assert slot.heatmap_level == 5
@@ -5,24 +5,29 @@ Tests for UserProfile model methods including token generation and validation
 import pytest
 from datetime import timedelta
 from django.utils import timezone
-from django.contrib.auth.models import User
 from unittest.mock import patch
 
 from meetings.user_profile import UserProfile
 
 
-# =============================================================================
-# Fixtures
-# =============================================================================
+# The shared test_user fixture (session-committed user, re-fetched per
+# test) lives in conftest.py.
+
 
 @pytest.fixture
-def test_user(db):
-    """Create a test user with profile"""
-    return User.objects.create_user(
-        username='testuser',
-        email='test@example.com',
-        password='testpass123'
-    )
+def stepped_clock(monkeypatch):
+    """Make timezone.now() advance one second per call.
+
+    Lets regeneration tests assert a strictly increasing timestamp
+    without sleeping for real wall-clock time.
+    """
+    base = timezone.now()
+    calls = iter(range(1, 1000))
+
+    def _now():
+        return base + timedelta(seconds=next(calls))
+
+    monkeypatch.setattr('django.utils.timezone.now', _now)
 
 
 # =============================================================================
@@ -46,17 +51,13 @@ class TestGenerateVerificationToken:
         assert profile.email_verification_token == token
         assert profile.token_created_at is not None
     
-    def test_regeneration(self, test_user):
+    def test_regeneration(self, test_user, stepped_clock):
         """Test that old token is replaced with new one"""
         profile = test_user.profile
         
         first_token = profile.generate_verification_token()
         first_timestamp = profile.token_created_at
         
-        # Wait a tiny bit (simulate time passing)
-        import time
-        time.sleep(0.01)
-        
         second_token = profile.generate_verification_token()
         
         assert second_token != first_token
@@ -84,7 +85,8 @@ class TestIsVerificationTokenValid:
         
         assert profile.is_verification_token_valid() is True
     
-    @pytest.mark.parametrize("hours_offset,minutes_offset,expiry_hours,expected_valid,scenario", [
+    # (hours_offset, minutes_offset, expiry_hours, expected_valid, scenario)
+    EXPIRY_CASES = [
         (0, 0, 24, True, "Just created"),
         (23, 59, 24, True, "23h 59m old (24h expiry)"),
         (24, 1, 24, False, "24h 1m old (24h expiry)"),
@@ -92,25 +94,34 @@ class TestIsVerificationTokenValid:
         (0, 59, 1, True, "59m old (1h expiry)"),
         (1, 1, 1, False, "1h 1m old (1h expiry)"),
         (13, 0, 12, False, "13h old (12h expiry)"),
-    ])
-    def test_token_expiry(self, test_user, settings, hours_offset, minutes_offset, 
-                         expiry_hours, expected_valid, scenario):
-        """Test various token expiry scenarios"""
-        settings.EMAIL_VERIFICATION_TOKEN_EXPIRY_HOURS = expiry_hours
-        
+    ]
+
+    def test_token_expiry(self, test_user, monkeypatch):
+        """Test various token expiry scenarios
+
+        One test over a case table rather than parametrize: the check is
+        a pure attribute read, so re-running the user fixture and
+        transaction setup per case would be pure overhead.
+        """
         profile = test_user.profile
         profile.email_verification_token = 'test_token'
-        profile.token_created_at = timezone.now() - timedelta(hours=hours_offset, minutes=minutes_offset)
-        profile.save()
-        
-        assert profile.is_verification_token_valid() == expected_valid, f"Failed: {scenario}"
+
+        # One clock read for all cases; the offsets have minute-scale
+        # margins, so the loop's sub-millisecond runtime cannot flip them.
+        now = timezone.now()
+        for hours_offset, minutes_offset, expiry_hours, expected_valid, scenario in self.EXPIRY_CASES:
+            monkeypatch.setattr(
+                'django.conf.settings.EMAIL_VERIFICATION_TOKEN_EXPIRY_HOURS',
+                expiry_hours, raising=False)
+            profile.token_created_at = now - timedelta(hours=hours_offset, minutes=minutes_offset)
+
+            assert profile.is_verification_token_valid() == expected_valid, f"Failed: {scenario}"
     
     def test_no_token_created_at(self, test_user):
         """Test that None token_created_at returns False"""
         profile = test_user.profile
         profile.email_verification_token = 'test_token'
         profile.token_created_at = None
-        profile.save()
         
         assert profile.is_verification_token_valid() is False
 
@@ -123,7 +134,6 @@ class TestVerifyEmail:
         profile = test_user.profile
         profile.email_verified = False
         profile.email_verification_token = 'test_token'
-        profile.save()
         
         profile.verify_email()
         
@@ -135,7 +145,6 @@ class TestVerifyEmail:
         profile = test_user.profile
         profile.email_verified = True
         profile.email_verification_token = 'test_token'
-        profile.save()
         
         profile.verify_email()
         
@@ -146,7 +155,6 @@ class TestVerifyEmail:
         """Test that verification token is cleared"""
         profile = test_user.profile
         profile.email_verification_token = 'test_token'
-        profile.save()
         
         assert profile.email_verification_token == 'test_token'
         profile.verify_email()
@@ -174,17 +182,13 @@ class TestGeneratePasswordResetToken:
         assert profile.password_reset_token == token
         assert profile.password_reset_token_created_at is not None
     
-    def test_regeneration_multiple_requests(self, test_user):
+    def test_regeneration_multiple_requests(self, test_user, stepped_clock):
         """Test that old token is replaced when user requests reset multiple times"""
         profile = test_user.profile
         
         first_token = profile.generate_password_reset_token()
         first_timestamp = profile.password_reset_token_created_at
         
-        # Wait a tiny bit (simulate time passing)
-        import time
-        time.sleep(0.01)
-        
         second_token = profile.generate_password_reset_token()
         
         assert second_token != first_token
@@ -212,31 +216,41 @@ class TestIsPasswordResetTokenValid:
         
         assert profile.is_password_reset_token_valid() is True
     
-    @pytest.mark.parametrize("hours_offset,minutes_offset,expiry_hours,expected_valid,scenario", [
+    # (hours_offset, minutes_offset, expiry_hours, expected_valid, scenario)
+    EXPIRY_CASES = [
         (0, 0, 1, True, "Just created (1h expiry)"),
         (0, 59, 1, True, "59m old (1h expiry)"),
         (1, 1, 1, False, "1h 1m old (1h expiry)"),
         (24, 0, 1, False, "24h old (well expired, 1h expiry)"),
         (3, 0, 2, False, "3h old (2h expiry)"),
-    ])
-    def test_token_expiry(self, test_user, settings, hours_offset, minutes_offset, 
-                         expiry_hours, expected_valid, scenario):
-        """Test various token expiry scenarios"""
-        settings.PASSWORD_RESET_TOKEN_EXPIRY_HOURS = expiry_hours
-        
+    ]
+
+    def test_token_expiry(self, test_user, monkeypatch):
+        """Test various token expiry scenarios
+
+        One test over a case table rather than parametrize: the check is
+        a pure attribute read, so re-running the user fixture and
+        transaction setup per case would be pure overhead.
+        """
         profile = test_user.profile
         profile.password_reset_token = 'test_token'
-        profile.password_reset_token_created_at = timezone.now() - timedelta(hours=hours_offset, minutes=minutes_offset)
-        profile.save()
-        
-        assert profile.is_password_reset_token_valid() == expected_valid, f"Failed: {scenario}"
+
+        # One clock read for all cases; the offsets have minute-scale
+        # margins, so the loop's sub-millisecond runtime cannot flip them.
+        now = timezone.now()
+        for hours_offset, minutes_offset, expiry_hours, expected_valid, scenario in self.EXPIRY_CASES:
+            monkeypatch.setattr(
+                'django.conf.settings.PASSWORD_RESET_TOKEN_EXPIRY_HOURS',
+                expiry_hours, raising=False)
+            profile.password_reset_token_created_at = now - timedelta(hours=hours_offset, minutes=minutes_offset)
+
+            assert profile.is_password_reset_token_valid() == expected_valid, f"Failed: {scenario}"
     
     def test_no_token_created_at(self, test_user):
         """Test that None token_created_at returns False"""
         profile = test_user.profile
         profile.password_reset_token = 'test_token'
         profile.password_reset_token_created_at = None
-        profile.save()
         
         assert profile.is_password_reset_token_valid() is False
 
@@ -249,7 +263,6 @@ class TestClearPasswordResetToken:
         profile = test_user.profile
         profile.password_reset_token = 'test_token'
         profile.password_reset_token_created_at = timezone.now()
-        profile.save()
         
         assert profile.password_reset_token == 'test_token'
         
@@ -262,7 +275,6 @@ class TestClearPasswordResetToken:
         """Test clearing when no token exists (should not error)"""
         profile = test_user.profile
         profile.password_reset_token = None
-        profile.save()
         
         # Should not raise error
         profile.clear_password_reset_token()
@@ -273,7 +285,6 @@ class TestClearPasswordResetToken:
         """Test calling clear twice (should not error)"""
         profile = test_user.profile
         profile.password_reset_token = 'test_token'
-        profile.save()
         
         profile.clear_password_reset_token()
         assert profile.password_reset_token is None
@@ -2,23 +2,50 @@
 Unit tests for view helper functions
 Tests helper functions used in views.py
 """
+import itertools
 import pytest
-from django.test import RequestFactory
+import re
+import uuid
+from types import SimpleNamespace
 from meetings.views import get_or_create_creator_id
 
+# Pre-compiled UUID shape check: cheaper than uuid.UUID() parsing and
+# just as strict for validating the generated creator_id format.
+_UUID_RE = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$')
 
-@pytest.mark.django_db
+
+@pytest.fixture(autouse=True, scope='module')
+def _fast_uuid4():
+    """Back uuid.uuid4 with a counter for this module.
+
+    The helper only needs distinct ids, not entropy, so skip the
+    urandom read behind each real uuid4() call.
+    """
+    counter = itertools.count(1)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(uuid, 'uuid4', lambda: uuid.UUID(int=next(counter)))
+        yield
+
+
+def _fake_request(session=None):
+    """Minimal request stand-in: the helper only touches request.session,
+    so a namespace with a session dict replaces the WSGI machinery a
+    RequestFactory request would drag in."""
+    return SimpleNamespace(session={} if session is None else session)
+
+
+@pytest.mark.no_db
 class TestGetOrCreateCreatorId:
-    """Test cases for get_or_create_creator_id function"""
-    
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.factory = RequestFactory()
+    """Test cases for get_or_create_creator_id function
+
+    The helper only reads and writes request.session (a plain dict
+    here), so no test in this class touches the database.
+    """
     
     def test_session_has_creator_id(self):
         """Test when session already has creator_id"""
-        request = self.factory.get('/')
-        request.session = {'creator_id': 'existing-uuid-123'}
+        request = _fake_request({'creator_id': 'existing-uuid-123'})
         
         result = get_or_create_creator_id(request)
         
@@ -27,8 +54,7 @@ class TestGetOrCreateCreatorId:
     
     def test_session_empty(self):
         """Test when session is empty"""
-        request = self.factory.get('/')
-        request.session = {}
+        request = _fake_request()
         
         result = get_or_create_creator_id(request)
         
@@ -38,8 +64,7 @@ class TestGetOrCreateCreatorId:
     
     def test_session_corrupted(self):
         """Test when session has corrupted creator_id"""
-        request = self.factory.get('/')
-        request.session = {'creator_id': None}
+        request = _fake_request({'creator_id': None})
         
         # Should regenerate when None
         result = get_or_create_creator_id(request)
@@ -51,8 +76,7 @@ class TestGetOrCreateCreatorId:
     
     def test_multiple_calls_same_session(self):
         """Test multiple calls with same session return same ID"""
-        request = self.factory.get('/')
-        request.session = {}
+        request = _fake_request()
         
         result1 = get_or_create_creator_id(request)
         result2 = get_or_create_creator_id(request)
@@ -61,11 +85,8 @@ class TestGetOrCreateCreatorId:
     
     def test_different_sessions_different_ids(self):
         """Test different sessions get different creator IDs"""
-        request1 = self.factory.get('/')
-        request1.session = {}
-        
-        request2 = self.factory.get('/')
-        request2.session = {}
+        request1 = _fake_request()
+        request2 = _fake_request()
         
         result1 = get_or_create_creator_id(request1)
         result2 = get_or_create_creator_id(request2)
@@ -74,17 +95,9 @@ class TestGetOrCreateCreatorId:
     
     def test_creator_id_format(self):
         """Test that creator_id is in UUID format"""
-        request = self.factory.get('/')
-        request.session = {}
+        request = _fake_request()
         
         result = get_or_create_creator_id(request)
         
         # Check it's a valid UUID format (string with hyphens)
-        import uuid
-        try:
-            uuid.UUID(result)
-            is_valid_uuid = True
-        except ValueError:
-            is_valid_uuid = False
-        
-        assert is_valid_uuid
+        assert _UUID_RE.match(result)